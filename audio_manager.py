@@ -4,9 +4,15 @@
 """
 
 import os
+import shutil
+import subprocess
 import threading
 import time
-from typing import Optional, Dict, List
+import itertools
+import queue
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Dict, List, NamedTuple
 import hashlib
 
 # 嘗試導入音訊相關庫
@@ -27,7 +33,123 @@ except ImportError:
     gtts_module = None
 
 from messages import Messages, SystemConfig
-from utils import logger, FileManager
+from utils import logger, FileManager, PygameEventPump
+
+
+class AudioItem(NamedTuple):
+    """播放佇列項目（依 priority、seq 排序）"""
+    priority: int
+    seq: int
+    file: Optional[str]  # None 表示播放線程結束信號
+    text: str
+    timestamp: float
+
+
+class AudioCache:
+    """
+    語音快取（LRU）
+    
+    統一管理文字鍵到檔案路徑的對應、已解碼的pygame.mixer.Sound，
+    以及磁碟上已存在的語音檔案；超出上限時淘汰最久未使用的項目並刪除其檔案，
+    仍在播放佇列中或播放中的檔案延後至釋放後才刪除
+    """
+    
+    def __init__(self, max_items: int, known_files: Optional[set] = None):
+        """
+        初始化語音快取
+        
+        Args:
+            max_items: 最多保留的語音項目數
+            known_files: 磁碟上已存在的語音檔案路徑
+        """
+        self.max_items = max_items
+        self._entries: "OrderedDict[tuple, str]" = OrderedDict()
+        self._sounds: Dict[str, object] = {}
+        self._known_files: set = set(known_files or ())
+        # 仍在播放佇列中或播放中的檔案（路徑 -> 引用數）及其中已被淘汰、待釋放後刪除的檔案
+        self._pinned: Dict[str, int] = {}
+        self._deferred: set = set()
+        self._lock = threading.Lock()
+    
+    def get(self, key: tuple) -> Optional[str]:
+        """獲取快取的檔案路徑，命中時標記為最近使用"""
+        with self._lock:
+            filepath = self._entries.get(key)
+            if filepath is not None:
+                self._entries.move_to_end(key)
+            return filepath
+    
+    def put(self, key: tuple, filepath: str):
+        """加入快取項目，超出上限時淘汰最久未使用的項目"""
+        with self._lock:
+            self._entries[key] = filepath
+            self._entries.move_to_end(key)
+            self._known_files.add(filepath)
+            # 延後刪除前再次被使用的檔案保留
+            self._deferred.discard(filepath)
+            
+            while len(self._entries) > self.max_items:
+                _, evicted = self._entries.popitem(last=False)
+                self._evict_file(evicted)
+    
+    def _evict_file(self, filepath: str):
+        """淘汰項目的檔案，仍在佇列中或播放中時延後至釋放後刪除"""
+        if filepath in self._pinned:
+            self._deferred.add(filepath)
+            return
+        self._delete_file(filepath)
+    
+    def _delete_file(self, filepath: str):
+        """釋放Sound並刪除語音檔案及轉換WAV前的來源MP3"""
+        self._sounds.pop(filepath, None)
+        source = os.path.splitext(filepath)[0] + '.' + SystemConfig.SOUND_FORMAT
+        for path in dict.fromkeys((filepath, source)):
+            self._known_files.discard(path)
+            try:
+                os.unlink(path)
+                logger.debug(f"已淘汰語音檔案: {path}")
+            except OSError:
+                pass
+    
+    def pin(self, filepath: str):
+        """標記檔案仍在播放佇列中或播放中，期間淘汰不會刪除檔案"""
+        with self._lock:
+            self._pinned[filepath] = self._pinned.get(filepath, 0) + 1
+    
+    def unpin(self, filepath: str):
+        """釋放pin()的標記，已被淘汰的檔案於最後一次釋放時刪除"""
+        with self._lock:
+            count = self._pinned.get(filepath, 0) - 1
+            if count > 0:
+                self._pinned[filepath] = count
+                return
+            self._pinned.pop(filepath, None)
+            if filepath in self._deferred:
+                self._deferred.discard(filepath)
+                self._delete_file(filepath)
+    
+    def has_file(self, filepath: str) -> bool:
+        """檢查語音檔案是否已存在於磁碟"""
+        return filepath in self._known_files
+    
+    def add_file(self, filepath: str):
+        """記錄已存在於磁碟的語音檔案"""
+        with self._lock:
+            self._known_files.add(filepath)
+    
+    def get_sound(self, filepath: str):
+        """獲取已解碼的Sound"""
+        return self._sounds.get(filepath)
+    
+    def put_sound(self, filepath: str, sound):
+        """緩存已解碼的Sound"""
+        with self._lock:
+            self._sounds[filepath] = sound
+    
+    def clear_sounds(self):
+        """釋放所有已解碼的Sound"""
+        with self._lock:
+            self._sounds.clear()
 
 
 class AudioManager:
@@ -38,21 +160,67 @@ class AudioManager:
         self.is_initialized = False
         self.is_muted = False
         self.current_volume = 0.7
-        self.voice_queue = []
+        # 播放佇列：AudioItem，序號確保同優先級按加入順序播放
+        self.voice_queue: queue.PriorityQueue = queue.PriorityQueue()
+        self._queue_counter = itertools.count()
+        # 佇列去重：已在佇列中的文字、最近播放時間（由_queue_lock保護）
+        self._queued_texts: set = set()
+        self._recent_texts: Dict[str, float] = {}
+        self._queue_lock = threading.Lock()
         self.is_playing = False
         self.play_thread = None
         
-        # 音訊緩存
-        self.audio_cache = {}
-        
-        # 初始化音訊系統
-        self._initialize_audio_system()
+        # 播放結束事件（由共用的pygame事件線程設定）；事件類型於初始化時配置，
+        # 與其他元件的自訂事件互不衝突
+        self._playback_done = threading.Event()
+        self._end_event_type: Optional[int] = None
+        self._end_event_enabled = False
+        # 是否由本實例初始化混音器（清理時只關閉自己開啟的混音器）
+        self._owns_mixer = False
+        
+        # 語音合成後端（'gtts' 或離線的 'piper'）
+        self.tts_backend = self._select_tts_backend()
+        # 將gTTS的MP3轉為WAV，播放時免去MP3解碼
+        self._ffmpeg_path = (shutil.which(SystemConfig.FFMPEG_EXECUTABLE)
+                             if SystemConfig.AUDIO_TRANSCODE_WAV else None)
+        
+        # 音訊緩存：(後端, 語言, 慢速, 文字) -> 檔案路徑與已解碼Sound
+        # 磁碟上已存在的語音檔案於啟動時以單次目錄掃描建立，取代逐檔stat
+        self.audio_cache = AudioCache(
+            max_items=SystemConfig.AUDIO_CACHE_MAX,
+            known_files={
+                os.path.join(SystemConfig.SOUND_DIR, name)
+                for name in FileManager.list_files(SystemConfig.SOUND_DIR)
+            }
+        )
+        self._current_channel = None
+        
+        # 初始化音訊系統並啟動常駐播放線程
+        if self._initialize_audio_system():
+            self._start_playback_thread()
         
-        # 預生成常用語音
-        self._pregenerate_common_sounds()
+        # 預生成常用語音（背景執行，避免阻塞初始化）
+        self._path_locks: Dict[str, threading.Lock] = {}
+        self._path_locks_guard = threading.Lock()
+        self._pregenerate_thread = threading.Thread(target=self._pregenerate_common_sounds, daemon=True)
+        self._pregenerate_thread.start()
         
         logger.info("語音管理器初始化完成")
     
+    def _select_tts_backend(self) -> str:
+        """
+        選擇語音合成後端
+        
+        Returns:
+            str: 'piper'（離線合成）或 'gtts'
+        """
+        if SystemConfig.TTS_BACKEND == 'piper':
+            if SystemConfig.PIPER_MODEL and shutil.which(SystemConfig.PIPER_EXECUTABLE):
+                logger.info("使用piper離線語音合成")
+                return 'piper'
+            logger.warning("piper或其語音模型不可用，改用gTTS")
+        return 'gtts'
+    
     def _initialize_audio_system(self) -> bool:
         """
         初始化音訊系統
@@ -65,17 +233,46 @@ class AudioManager:
             return False
         
         try:
-            pygame_module.mixer.init(frequency=22050, size=-16, channels=2, buffer=512)
+            # 混音器已由其他元件初始化時直接沿用，避免重複初始化
+            if pygame_module.mixer.get_init():
+                logger.debug("pygame混音器已初始化，沿用現有設定")
+            else:
+                # 先以pre_init記錄參數，確保其他模組隱式初始化時沿用相同設定
+                pygame_module.mixer.pre_init(
+                    frequency=SystemConfig.AUDIO_FREQUENCY,
+                    size=SystemConfig.AUDIO_SIZE,
+                    channels=SystemConfig.AUDIO_CHANNELS,
+                    buffer=SystemConfig.AUDIO_BUFFER
+                )
+                pygame_module.mixer.init()
+                self._owns_mixer = True
             self.is_initialized = True
+            self._setup_playback_end_event()
             logger.info("pygame音訊系統初始化成功")
             return True
         except Exception as e:
             logger.error(f"音訊系統初始化失敗: {e}")
             return False
     
+    def _setup_playback_end_event(self):
+        """註冊播放結束事件，取代輪詢等待播放完成"""
+        if not pygame_module:
+            return
+        
+        try:
+            # pygame事件佇列依賴video子系統（不會建立視窗）
+            if not pygame_module.display.get_init():
+                pygame_module.display.init()
+            # 由共用事件線程分派，避免與其他元件各自讀取事件佇列而互相取走結束事件
+            self._end_event_type = PygameEventPump.register(pygame_module, self._playback_done.set)
+            pygame_module.mixer.music.set_endevent(self._end_event_type)
+            self._end_event_enabled = True
+        except Exception as e:
+            logger.warning(f"無法註冊播放結束事件，改用輪詢等待: {e}")
+    
     def _pregenerate_common_sounds(self):
         """預生成常用語音檔案"""
-        if not GTTS_AVAILABLE or not gtts_module:
+        if self.tts_backend == 'gtts' and (not GTTS_AVAILABLE or not gtts_module):
             logger.warning("gTTS未安裝，無法生成語音檔案")
             return
         
@@ -95,16 +292,61 @@ class AudioManager:
         for instruction in Messages.ACTION_INSTRUCTIONS.values():
             texts_to_generate.append(instruction)
         
+        # 去除重複文字（保留原有順序）
+        texts_to_generate = list(dict.fromkeys(texts_to_generate))
+        
         logger.info("開始預生成語音檔案...")
         
-        for text in texts_to_generate:
-            try:
-                self._generate_audio_file(text)
-            except Exception as e:
-                logger.error(f"生成語音檔案失敗: {text}, 錯誤: {e}")
+        # 語音合成為I/O密集（網路或子程序），使用線程池並行生成
+        with ThreadPoolExecutor(max_workers=SystemConfig.TTS_PREGENERATE_WORKERS) as executor:
+            futures = {executor.submit(self._generate_audio_file, text): text
+                       for text in texts_to_generate}
+        
+        for future, text in futures.items():
+            error = future.exception()
+            if error:
+                logger.error(f"生成語音檔案失敗: {text}, 錯誤: {error}")
+            elif future.result():
+                # 預先解碼到記憶體，播放時無需再讀檔解碼
+                self._cache_sound(future.result())
         
         logger.info("語音檔案預生成完成")
     
+    def _cache_sound(self, filepath: str):
+        """
+        將音訊檔案解碼為pygame.mixer.Sound並緩存
+        
+        Args:
+            filepath: 音訊檔案路徑
+        """
+        self._get_sound(filepath)
+    
+    def _get_sound(self, filepath: str):
+        """
+        獲取已解碼的pygame.mixer.Sound，未緩存時載入並緩存
+        
+        Args:
+            filepath: 音訊檔案路徑
+            
+        Returns:
+            pygame.mixer.Sound，載入失敗時返回None
+        """
+        sound = self.audio_cache.get_sound(filepath)
+        if sound is not None:
+            return sound
+        
+        if not self.is_initialized or not pygame_module:
+            return None
+        
+        try:
+            sound = pygame_module.mixer.Sound(filepath)
+        except Exception as e:
+            logger.warning(f"無法載入音訊檔案: {filepath}, 錯誤: {e}")
+            return None
+        
+        self.audio_cache.put_sound(filepath, sound)
+        return sound
+    
     def _generate_audio_file(self, text: str) -> Optional[str]:
         """
         生成語音檔案
@@ -115,32 +357,170 @@ class AudioManager:
         Returns:
             Optional[str]: 生成的檔案路徑，失敗時返回None
         """
-        if not GTTS_AVAILABLE or not gtts_module:
+        # 快取命中時直接返回，省去hash計算與檔案系統查詢
+        cache_key = (self.tts_backend, SystemConfig.TTS_LANGUAGE, SystemConfig.TTS_SLOW, text)
+        cached = self.audio_cache.get(cache_key)
+        if cached:
+            return cached
+        
+        filepath = None
+        if self.tts_backend == 'piper':
+            filepath = self._generate_with_backend(text, 'piper')
+        
+        # 離線合成失敗時退回gTTS
+        if not filepath:
+            filepath = self._generate_with_backend(text, 'gtts')
+            if filepath and self._ffmpeg_path:
+                filepath = self._transcode_to_wav(filepath)
+        
+        if filepath:
+            self.audio_cache.put(cache_key, filepath)
+        return filepath
+    
+    def _get_voice_file_path(self, text: str, backend: str) -> str:
+        """
+        計算語音檔案路徑
+        
+        Args:
+            text: 語音文字
+            backend: 語音合成後端
+            
+        Returns:
+            str: 語音檔案路徑
+        """
+        # 使用後端設定與文字的hash值，避免設定變更後誤用舊檔案
+        if backend == 'piper':
+            key_source = f"piper|{SystemConfig.PIPER_MODEL}|{text}"
+            extension = 'wav'
+        else:
+            key_source = f"{SystemConfig.TTS_LANGUAGE}|{SystemConfig.TTS_SLOW}|{text}"
+            extension = SystemConfig.SOUND_FORMAT
+        
+        text_hash = hashlib.blake2b(key_source.encode('utf-8'), digest_size=4).hexdigest()
+        return FileManager.get_sound_file_path(f"voice_{text_hash}", extension)
+    
+    def _generate_with_backend(self, text: str, backend: str) -> Optional[str]:
+        """
+        使用指定後端生成語音檔案
+        
+        Args:
+            text: 要轉換的文字
+            backend: 語音合成後端（'gtts' 或 'piper'）
+            
+        Returns:
+            Optional[str]: 生成的檔案路徑，失敗時返回None
+        """
+        if backend == 'gtts' and (not GTTS_AVAILABLE or not gtts_module):
             logger.warning("gTTS不可用，無法生成語音檔案")
             return None
         
         try:
-            # 生成檔案名（使用文字的hash值）
-            text_hash = hashlib.md5(text.encode('utf-8')).hexdigest()[:8]
-            filename = f"voice_{text_hash}"
-            filepath = FileManager.get_sound_file_path(filename)
-            
-            # 檢查檔案是否已存在
-            if FileManager.file_exists(filepath):
-                logger.debug(f"語音檔案已存在: {filepath}")
-                return filepath
+            filepath = self._get_voice_file_path(text, backend)
             
-            # 生成語音檔案
-            tts = gtts_module(text=text, lang=SystemConfig.TTS_LANGUAGE, slow=SystemConfig.TTS_SLOW)
-            tts.save(filepath)
+            # 背景預生成與即時播放可能同時請求同一檔案，逐檔加鎖避免重複寫入
+            with self._get_path_lock(filepath):
+                # 檢查檔案是否已存在
+                if self.audio_cache.has_file(filepath):
+                    logger.debug(f"語音檔案已存在: {filepath}")
+                    return filepath
+                
+                # 生成語音檔案：先寫入暫存檔再原子替換，網路中斷時不會留下
+                # 被啟動掃描誤認為有效快取的不完整檔案
+                tmp_path = filepath + '.tmp'
+                try:
+                    if backend == 'piper':
+                        self._synthesize_piper(text, tmp_path)
+                    else:
+                        # 以64KB緩衝直接串流寫入，合併網路分塊的小量寫入
+                        tts = gtts_module(text=text, lang=SystemConfig.TTS_LANGUAGE, slow=SystemConfig.TTS_SLOW)
+                        with open(tmp_path, 'wb', buffering=65536) as fp:
+                            tts.write_to_fp(fp)
+                    os.replace(tmp_path, filepath)
+                except BaseException:
+                    try:
+                        os.unlink(tmp_path)
+                    except OSError:
+                        pass
+                    raise
+                
+                self.audio_cache.add_file(filepath)
             
             logger.info(f"語音檔案已生成: {filepath}")
             return filepath
             
         except Exception as e:
-            logger.error(f"生成語音檔案時發生錯誤: {e}")
+            logger.error(f"生成語音檔案時發生錯誤（{backend}）: {e}")
             return None
     
+    def _get_path_lock(self, filepath: str) -> threading.Lock:
+        """獲取指定檔案路徑的生成鎖"""
+        with self._path_locks_guard:
+            lock = self._path_locks.get(filepath)
+            if lock is None:
+                lock = self._path_locks[filepath] = threading.Lock()
+            return lock
+    
+    def _transcode_to_wav(self, mp3_path: str) -> str:
+        """
+        將MP3轉為混音器取樣率的16位元PCM WAV（只需轉換一次）
+        
+        Args:
+            mp3_path: MP3檔案路徑
+            
+        Returns:
+            str: WAV檔案路徑，轉換失敗時返回原MP3路徑
+        """
+        wav_path = os.path.splitext(mp3_path)[0] + '.wav'
+        
+        # 背景預生成與即時播放可能同時轉換同一檔案；先寫入暫存檔再原子替換，
+        # 讀取端不會載入到寫到一半的WAV
+        with self._get_path_lock(wav_path):
+            if self.audio_cache.has_file(wav_path):
+                return wav_path
+            
+            tmp_path = wav_path + '.tmp'
+            try:
+                subprocess.run(
+                    [self._ffmpeg_path, '-y', '-loglevel', 'error', '-i', mp3_path,
+                     '-ar', str(SystemConfig.AUDIO_FREQUENCY),
+                     '-ac', str(SystemConfig.AUDIO_CHANNELS),
+                     '-acodec', 'pcm_s16le', '-f', 'wav', tmp_path],
+                    capture_output=True,
+                    check=True,
+                    timeout=SystemConfig.FFMPEG_TIMEOUT
+                )
+                os.replace(tmp_path, wav_path)
+            except Exception as e:
+                logger.warning(f"轉換WAV失敗，改用MP3: {mp3_path}, 錯誤: {e}")
+                # 移除可能殘留的不完整檔案
+                try:
+                    os.remove(tmp_path)
+                except OSError:
+                    pass
+                return mp3_path
+            
+            self.audio_cache.add_file(wav_path)
+        
+        logger.debug(f"已轉換為WAV: {wav_path}")
+        return wav_path
+    
+    def _synthesize_piper(self, text: str, filepath: str):
+        """
+        使用piper命令列工具離線合成WAV語音檔案
+        
+        Args:
+            text: 要轉換的文字
+            filepath: 輸出的WAV檔案路徑
+        """
+        subprocess.run(
+            [SystemConfig.PIPER_EXECUTABLE, '--model', SystemConfig.PIPER_MODEL,
+             '--output_file', filepath],
+            input=text.encode('utf-8'),
+            capture_output=True,
+            check=True,
+            timeout=SystemConfig.PIPER_TIMEOUT
+        )
+    
     def play_text(self, text: str, priority: int = 1) -> bool:
         """
         播放文字語音
@@ -160,27 +540,27 @@ class AudioManager:
             logger.warning("音訊系統未初始化，無法播放語音")
             return False
         
-        # 生成音訊檔案
+        # 相同文字已在佇列中或剛播放過時略過，避免堆積重複語音
+        # 檢查與佔位在同一把鎖內完成，避免多個線程同時加入相同文字
+        with self._queue_lock:
+            if text in self._queued_texts:
+                logger.debug("相同語音已在佇列中，跳過")
+                return False
+            if time.time() - self._recent_texts.get(text, 0.0) < SystemConfig.AUDIO_DUPLICATE_TTL:
+                logger.debug("相同語音剛播放過，跳過")
+                return False
+            self._queued_texts.add(text)
+        
+        # 生成音訊檔案（可能需要網路，不在鎖內執行）
         audio_file = self._generate_audio_file(text)
         if not audio_file:
+            with self._queue_lock:
+                self._queued_texts.discard(text)
             return False
         
-        # 添加到播放佇列
-        audio_item = {
-            'file': audio_file,
-            'text': text,
-            'priority': priority,
-            'timestamp': time.time()
-        }
-        
-        self.voice_queue.append(audio_item)
-        
-        # 按優先級排序
-        self.voice_queue.sort(key=lambda x: x['priority'])
-        
-        # 啟動播放線程
-        if not self.is_playing:
-            self._start_playback_thread()
+        # 按優先級加入播放佇列，由常駐播放線程取出（播放完畢前檔案不會被快取淘汰刪除）
+        self.audio_cache.pin(audio_file)
+        self.voice_queue.put(AudioItem(priority, next(self._queue_counter), audio_file, text, time.time()))
         
         logger.debug(f"語音已添加到佇列: {text[:20]}...")
         return True
@@ -194,30 +574,63 @@ class AudioManager:
         self.play_thread.start()
     
     def _playback_worker(self):
-        """播放工作線程"""
-        self.is_playing = True
-        
-        while self.voice_queue and not self.is_muted:
+        """常駐播放工作線程，阻塞等待佇列中的音訊"""
+        while True:
+            # 獲取下一個要播放的音訊
+            audio_item = self.voice_queue.get()
+            
+            # 沒有檔案的項目為結束信號
+            if audio_item.file is None:
+                self.voice_queue.task_done()
+                break
+            
             try:
-                # 獲取下一個要播放的音訊
-                audio_item = self.voice_queue.pop(0)
+                with self._queue_lock:
+                    self._queued_texts.discard(audio_item.text)
+                if self.is_muted:
+                    continue
                 
-                # 播放音訊檔案
-                self._play_audio_file(audio_item['file'])
+                self.is_playing = True
                 
-                # 等待播放完成
-                while pygame_module and pygame_module.mixer.get_busy():
-                    time.sleep(0.1)
+                # 播放音訊檔案並等待播放完成
+                self._playback_done.clear()
+                if self._play_audio_file(audio_item.file):
+                    self._wait_for_playback()
+                self._mark_recently_played(audio_item.text)
                 
-                # 短暫延遲
-                time.sleep(0.5)
+                # 短暫間隔
+                time.sleep(SystemConfig.AUDIO_CLIP_GAP)
                 
             except Exception as e:
                 logger.error(f"播放音訊時發生錯誤: {e}")
+            finally:
+                self.is_playing = False
+                self.audio_cache.unpin(audio_item.file)
+                self.voice_queue.task_done()
         
-        self.is_playing = False
         logger.debug("播放線程結束")
     
+    def _mark_recently_played(self, text: str):
+        """記錄文字的播放時間，並清除已過期的紀錄"""
+        now = time.time()
+        with self._queue_lock:
+            self._recent_texts[text] = now
+            
+            if len(self._recent_texts) > 64:
+                ttl = SystemConfig.AUDIO_DUPLICATE_TTL
+                self._recent_texts = {t: ts for t, ts in self._recent_texts.items() if now - ts < ttl}
+    
+    def _wait_for_playback(self):
+        """等待當前音訊播放完成"""
+        if self._end_event_enabled:
+            self._playback_done.wait(timeout=SystemConfig.AUDIO_PLAYBACK_TIMEOUT)
+            return
+        
+        # 無法使用結束事件時退回輪詢
+        while pygame_module and (pygame_module.mixer.music.get_busy() or
+                                 pygame_module.mixer.get_busy()):
+            time.sleep(0.1)
+    
     def _play_audio_file(self, filepath: str) -> bool:
         """
         播放音訊檔案
@@ -228,11 +641,24 @@ class AudioManager:
         Returns:
             bool: 是否成功播放
         """
-        if not FileManager.file_exists(filepath) or not pygame_module:
+        if not self.audio_cache.has_file(filepath) or not pygame_module:
             logger.error(f"音訊檔案不存在或pygame不可用: {filepath}")
             return False
         
         try:
+            # 以Sound在空閒的混音聲道播放，不佔用單一的music串流
+            sound = self._get_sound(filepath)
+            if sound is not None:
+                channel = pygame_module.mixer.find_channel(True)
+                channel.set_volume(self.current_volume)
+                if self._end_event_enabled:
+                    channel.set_endevent(self._end_event_type)
+                channel.play(sound)
+                self._current_channel = channel
+                logger.debug(f"開始播放音訊: {filepath}")
+                return True
+            
+            # 無法解碼為Sound時退回music串流
             pygame_module.mixer.music.load(filepath)
             pygame_module.mixer.music.set_volume(self.current_volume)
             pygame_module.mixer.music.play()
@@ -316,6 +742,8 @@ class AudioManager:
         self.current_volume = max(0.0, min(1.0, volume))
         if self.is_initialized and pygame_module:
             pygame_module.mixer.music.set_volume(self.current_volume)
+            if self._current_channel is not None:
+                self._current_channel.set_volume(self.current_volume)
         logger.info(f"音量已設定為: {self.current_volume}")
     
     def get_volume(self) -> float:
@@ -326,29 +754,52 @@ class AudioManager:
         """停止當前播放"""
         if self.is_initialized and pygame_module:
             pygame_module.mixer.music.stop()
+            pygame_module.mixer.stop()
+        self._playback_done.set()
         logger.debug("已停止當前播放")
     
     def stop_all_playback(self):
         """停止所有播放並清空佇列"""
-        self.voice_queue.clear()
+        with self._queue_lock:
+            while True:
+                try:
+                    audio_item = self.voice_queue.get_nowait()
+                except queue.Empty:
+                    break
+                if audio_item.file is not None:
+                    self.audio_cache.unpin(audio_item.file)
+                self.voice_queue.task_done()
+            self._queued_texts.clear()
         self.stop_current_playback()
         logger.debug("已停止所有播放並清空佇列")
     
     def get_queue_size(self) -> int:
         """獲取播放佇列大小"""
-        return len(self.voice_queue)
+        return self.voice_queue.qsize()
     
     def is_busy(self) -> bool:
         """檢查是否正在播放"""
         if not self.is_initialized or not pygame_module:
             return False
-        return bool(pygame_module.mixer.get_busy()) or bool(self.voice_queue)
+        return bool(pygame_module.mixer.get_busy()) or self.is_playing or not self.voice_queue.empty()
     
     def cleanup(self):
         """清理資源"""
         self.stop_all_playback()
+        
+        # 通知播放線程結束
+        if self.play_thread and self.play_thread.is_alive():
+            self.voice_queue.put(AudioItem(-1, next(self._queue_counter), None, '', time.time()))
+            self.play_thread.join(timeout=1.0)
+        
+        self.audio_cache.clear_sounds()
+        self._current_channel = None
+        PygameEventPump.unregister(self._end_event_type)
+        self._end_event_enabled = False
         if self.is_initialized and pygame_module:
-            pygame_module.mixer.quit()
+            self.is_initialized = False
+            if self._owns_mixer:
+                pygame_module.mixer.quit()
         logger.info("語音管理器已清理")
 
 
@@ -366,6 +817,7 @@ class VoiceInstructionManager:
         self.instruction_thread = None
         self.is_running = False
         self.interval = 15.0  # 預設間隔15秒
+        self._stop_event = threading.Event()
     
     def start_continuous_instructions(self, interval: float = 15.0):
         """
@@ -379,17 +831,16 @@ class VoiceInstructionManager:
         
         self.interval = interval
         self.is_running = True
+        self._stop_event.clear()
         
         def instruction_worker():
-            while self.is_running:
+            while not self._stop_event.is_set():
                 if not self.audio_manager.is_mute():
                     self.audio_manager.play_action_instructions()
                 
-                # 分段等待，便於快速響應停止信號
-                for _ in range(int(interval * 10)):
-                    if not self.is_running:
-                        break
-                    time.sleep(0.1)
+                # 等待下一輪，收到停止信號時立即返回
+                if self._stop_event.wait(timeout=self.interval):
+                    break
         
         self.instruction_thread = threading.Thread(target=instruction_worker, daemon=True)
         self.instruction_thread.start()
@@ -399,6 +850,7 @@ class VoiceInstructionManager:
     def stop_continuous_instructions(self):
         """停止連續播放動作說明"""
         self.is_running = False
+        self._stop_event.set()
         if self.instruction_thread:
             self.instruction_thread.join(timeout=1.0)
         logger.info("停止連續播放動作說明")
@@ -411,9 +863,17 @@ class VoiceInstructionManager:
 class AudioTester:
     """音訊測試器"""
     
-    def __init__(self):
-        """初始化音訊測試器"""
-        self.audio_manager = AudioManager()
+    def __init__(self, audio_manager: Optional[AudioManager] = None):
+        """
+        初始化音訊測試器
+        
+        Args:
+            audio_manager: 要測試的語音管理器，預設共用全域實例
+        """
+        if audio_manager is None:
+            # 共用全域實例，避免重複初始化混音器與預生成語音
+            audio_manager = get_audio_manager()
+        self.audio_manager = audio_manager
     
     def test_basic_playback(self):
         """測試基本播放功能"""
@@ -489,17 +949,51 @@ class AudioTester:
         self.test_mute_function()
         
         logger.info("音訊系統完整測試完成")
-        
-        # 清理
-        self.audio_manager.cleanup()
 
 
-# 全域音訊管理器實例
-audio_manager = AudioManager()
-voice_instruction_manager = VoiceInstructionManager(audio_manager)
+# 全域音訊管理器實例（首次使用時才建立，避免import時初始化混音器與預生成語音）
+_audio_manager: Optional[AudioManager] = None
+_voice_instruction_manager: Optional[VoiceInstructionManager] = None
+_instance_lock = threading.RLock()
+
+
+def get_audio_manager() -> AudioManager:
+    """獲取全域語音管理器實例"""
+    global _audio_manager
+    with _instance_lock:
+        if _audio_manager is None:
+            _audio_manager = AudioManager()
+        return _audio_manager
+
+
+def get_voice_instruction_manager() -> VoiceInstructionManager:
+    """獲取全域語音說明管理器實例"""
+    global _voice_instruction_manager
+    with _instance_lock:
+        if _voice_instruction_manager is None:
+            _voice_instruction_manager = VoiceInstructionManager(get_audio_manager())
+        return _voice_instruction_manager
+
+
+def stop_voice_instructions():
+    """停止連續播放動作說明（尚未建立實例時不做任何事）"""
+    if _voice_instruction_manager is not None:
+        _voice_instruction_manager.stop_continuous_instructions()
+
+
+def __getattr__(name: str):
+    """延遲建立 audio_manager / voice_instruction_manager 模組屬性"""
+    if name == 'audio_manager':
+        return get_audio_manager()
+    if name == 'voice_instruction_manager':
+        return get_voice_instruction_manager()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 if __name__ == "__main__":
     # 直接運行時進行測試
     tester = AudioTester()
-    tester.run_all_tests()
\ No newline at end of file
+    tester.run_all_tests()
+    
+    # 清理
+    tester.audio_manager.cleanup()
\ No newline at end of file
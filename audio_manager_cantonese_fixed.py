@@ -5,35 +5,131 @@
 """
 
 import os
-import pygame
+import importlib.util
+import json
+import queue
+import shutil
+import subprocess
+import sys
 import tempfile
 import time
 import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Iterable, Iterator, Tuple, NamedTuple
 import hashlib
+import re
 
-# 嘗試導入 pyttsx3
-try:
-    import pyttsx3
-    from pyttsx3.engine import Engine
-    PYTTSX3_AVAILABLE = True
-except ImportError:
-    PYTTSX3_AVAILABLE = False
-    pyttsx3 = None
-    Engine = None
+# 僅檢查 pyttsx3 / gTTS 是否已安裝（不執行模組），實際導入延後到首次使用時，
+# 避免其大量相依套件拖慢程式啟動；pygame（SDL）同樣延後到初始化混音器時才導入
+PYTTSX3_AVAILABLE = importlib.util.find_spec('pyttsx3') is not None
+GTTS_AVAILABLE = importlib.util.find_spec('gtts') is not None
 
-# 嘗試導入 gTTS
-try:
-    from gtts import gTTS as gTTSClass
-    GTTS_AVAILABLE = True
-except ImportError:
-    GTTS_AVAILABLE = False
-    gTTSClass = None
+pyttsx3 = None
+gTTSClass = None
+pygame = None
 
 from messages import SystemConfig, Messages
 from utils import logger
 
+# 香港粵語語音 (Microsoft Tracy) 的名稱或語言標籤
+_CANTONESE_VOICE_RE = re.compile(r'zh-HK|HongKong|Tracy', re.IGNORECASE)
+
+# 本管理器產生的語音檔案名稱（12位雜湊，含暫存檔）；AudioManager共用語音目錄但使用8位雜湊
+_OWN_SOUND_RE = re.compile(r'voice_(?:local_)?[0-9a-f]{12}\.\w+(?:\.tmp)?')
+
+# 本地語音子程序腳本
+SPEECH_WORKER_SCRIPT = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'speech_worker.py')
+
+
+def _find_cantonese_voice_in(voices) -> Optional[Any]:
+    """
+    在語音列表中查找香港粵語語音
+    
+    Args:
+        voices: pyttsx3 語音列表
+        
+    Returns:
+        Optional[Voice]: 第一個符合的語音，找不到時為None
+    """
+    return next((voice for voice in voices
+                 if voice and _CANTONESE_VOICE_RE.search(f"{voice.name or ''} {voice.languages or ''}")),
+                None)
+
+
+def _get_pyttsx3():
+    """延遲導入 pyttsx3"""
+    global pyttsx3
+    if pyttsx3 is None:
+        import pyttsx3 as pyttsx3_module
+        pyttsx3 = pyttsx3_module
+    return pyttsx3
+
+
+def _get_pygame():
+    """延遲導入 pygame"""
+    global pygame
+    if pygame is None:
+        import pygame as pygame_module
+        pygame = pygame_module
+    return pygame
+
+
+def _mixer_ready() -> bool:
+    """pygame 已導入且混音器已初始化"""
+    return pygame is not None and pygame.mixer.get_init() is not None
+
+
+def _get_gtts():
+    """延遲導入 gTTS"""
+    global gTTSClass
+    if gTTSClass is None:
+        from gtts import gTTS
+        gTTSClass = gTTS
+    return gTTSClass
+
+
+class SpeechCmd(NamedTuple):
+    """語音佇列中的指令（'speak'、'play'、'settings'、'stop'；子程序另支援'volume'、'rate'、'save'、'voice'）"""
+    kind: str
+    payload: Any = None
+
+
+# 佇列中屬於待播語音的指令種類（其餘為控制指令）：'speak'為文字，'play'為已備妥的語音檔案
+_SPEECH_KINDS = ('speak', 'play')
+
+
+def _name_for(text: str) -> str:
+    """
+    由文字計算語音檔案名稱中的雜湊值
+    
+    Args:
+        text: 語音文字
+        
+    Returns:
+        str: 12位十六進位雜湊值
+    """
+    return hashlib.blake2b(text.encode('utf-8'), digest_size=6).hexdigest()
+
+
+@lru_cache(maxsize=256)
+def _audio_path_for(text: str, local: bool = False) -> str:
+    """
+    由文字推導語音檔案路徑（結果會被快取，重複的提示不必再計算雜湊）
+    
+    Args:
+        text: 語音文字
+        local: 是否為本地引擎輸出的WAV檔案
+        
+    Returns:
+        str: 語音檔案路徑
+    """
+    text_hash = _name_for(text)
+    if local:
+        return str(Path(SystemConfig.SOUND_DIR) / f"voice_local_{text_hash}.wav")
+    return str(Path(SystemConfig.SOUND_DIR) / f"voice_{text_hash}.{SystemConfig.SOUND_FORMAT}")
+
 
 class CantoneseAudioManagerFixed:
     """粵語音訊管理器 - 修復版本"""
@@ -48,17 +144,65 @@ class CantoneseAudioManagerFixed:
         self.is_speaking = False
         self.use_local_voice = False
         
-        # 線程安全
-        self._engine_lock = threading.RLock()  # 使用可重入鎖
+        # 語音指令佇列：引擎只由語音線程操作，其他線程以SpeechCmd傳遞
+        # 播放、音量、語速等指令（None為停止訊號）；佇列本身不設上限，
+        # 控制指令不會被阻塞，待播語音數量由_enqueue_speech限制在SPEECH_QUEUE_MAX內
+        self._speech_queue: queue.Queue = queue.Queue()
+        self._speech_thread: Optional[threading.Thread] = None
+        # 本地語音子程序及其回覆佇列（僅由語音線程操作）
+        self._speech_proc: Optional[subprocess.Popen] = None
+        self._proc_replies: queue.Queue = queue.Queue()
+        # stop()為中斷語音而結束子程序時設置，語音線程據此重新啟動子程序而不視為故障
+        self._speech_interrupted = False
+        # 最近一次加入佇列的文字與時間，用於略過連續重複的提示
+        self._last_enqueue: Tuple[str, float] = ("", 0.0)
+        # 語音線程最近一段語音是否播放成功（供speak_blocking回報結果）
+        self._last_speech_ok = False
+        # 引擎目前實際套用的音量與語速；設定變更時佇列中最多只保留一個套用指令
+        self._applied_settings: Dict[str, Any] = {}
+        self._settings_pending = False
+        self._settings_lock = threading.Lock()
         
         # 音訊目錄
         self.sound_dir = Path(SystemConfig.SOUND_DIR)
         self.sound_dir.mkdir(exist_ok=True)
         
+        # 已確認存在的語音檔案，重複播放時免去檔案系統查詢
+        self._ready_files: set = set()
+        # 保護_ready_files與_sound_cache：預生成、預取與清理線程會同時增刪
+        self._cache_lock = threading.Lock()
+        # 文字 -> 可直接播放的gTTS語音檔案（已轉為WAV時為WAV路徑）
+        self._playable: Dict[str, str] = {}
+        # 將gTTS的MP3轉為WAV，載入時免去MP3解碼
+        self._ffmpeg_path = (shutil.which(SystemConfig.FFMPEG_EXECUTABLE)
+                             if SystemConfig.AUDIO_TRANSCODE_WAV else None)
+        # 語音線程、預生成與背景預取可能同時生成同一檔案，逐檔加鎖避免重複寫入
+        self._path_locks: Dict[str, threading.Lock] = {}
+        self._path_locks_guard = threading.Lock()
+        # 背景預取中或預取失敗的提示，每句同時只預取一次，失敗後不再於背景重試
+        self._prefetch_claimed: set = set()
+        self._prefetch_lock = threading.Lock()
+        
+        # 已載入的Sound物件（以檔案路徑為鍵），重複播放時免去重新讀檔與解碼
+        self._sound_cache: Dict[str, Any] = {}
+        
+        # 停止播放時設置，讓等待播放完成的語音線程立即醒來，不必等到下次檢查聲道狀態
+        self._playback_done = threading.Event()
+        # 專用語音聲道（由語音線程逐段播放）
+        self._speech_channel: Optional[Any] = None
+        
+        # 定期清理語音目錄，避免檔案無限累積
+        self._sweep_stop = threading.Event()
+        self._sweep_thread = threading.Thread(target=self._sweep_worker, daemon=True)
+        self._sweep_thread.start()
+        
         # 嘗試初始化本地粵語語音
         if PYTTSX3_AVAILABLE:
             if self._initialize_local_voice():
                 self.use_local_voice = True
+                # 常用提示預先由本地引擎輸出為檔案，播放時交由pygame混音
+                if SystemConfig.LOCAL_TTS_PREGENERATE:
+                    self._initialize_audio_system()
                 logger.info("使用本地粵語語音引擎")
             else:
                 logger.warning("本地粵語語音初始化失敗，將使用 gTTS")
@@ -68,6 +212,10 @@ class CantoneseAudioManagerFixed:
             self._initialize_audio_system()
             self._pregenerate_common_sounds()
         
+        # 語音線程依序播放佇列中的語音，speak()不會阻塞呼叫者
+        self._speech_thread = threading.Thread(target=self._speech_worker, daemon=True)
+        self._speech_thread.start()
+        
         logger.info("粵語音訊管理器初始化完成")
     
     def _initialize_local_voice(self) -> bool:
@@ -76,33 +224,30 @@ class CantoneseAudioManagerFixed:
             return False
             
         try:
-            with self._engine_lock:
-                assert pyttsx3 is not None  # Type guard
-                self.engine = pyttsx3.init()
-                
-                # 設置基本屬性
-                self.engine.setProperty('rate', self.rate)
-                self.engine.setProperty('volume', self.volume)
-                
-                # 查找並設置粵語語音
-                voices = self.engine.getProperty('voices')
-                if not voices:
-                    return False
-                
-                # 查找香港粵語語音 (Microsoft Tracy)
-                for voice in voices:
-                    if voice and (('zh-HK' in str(voice.languages) if voice.languages else False) or
-                                 ('HongKong' in voice.name if voice.name else False) or
-                                 ('Tracy' in voice.name if voice.name else False)):
-                        self.voice_id = voice.id
-                        self.engine.setProperty('voice', voice.id)
-                        logger.info(f"找到粵語語音: {voice.name}")
-                        return True
-                
+            self.engine = _get_pyttsx3().init()
+            
+            # 設置基本屬性
+            self.engine.setProperty('rate', self.rate)
+            self.engine.setProperty('volume', self.volume)
+            self._applied_settings = {'rate': self.rate, 'volume': self.volume}
+            
+            # 查找並設置粵語語音
+            voices = self.engine.getProperty('voices')
+            if not voices:
                 return False
-                
+            
+            # 查找香港粵語語音 (Microsoft Tracy)
+            voice = _find_cantonese_voice_in(voices)
+            if voice is None:
+                return False
+            
+            self.voice_id = voice.id
+            self.engine.setProperty('voice', voice.id)
+            logger.info("找到粵語語音: %s", voice.name)
+            return True
+            
         except Exception as e:
-            logger.error(f"本地語音引擎初始化失敗: {e}")
+            logger.error("本地語音引擎初始化失敗: %s", e)
             return False
     
     def _create_fresh_engine(self) -> bool:
@@ -123,7 +268,7 @@ class CantoneseAudioManagerFixed:
                             pass
                     del self.engine
                 except Exception as e:
-                    logger.debug(f"清理舊引擎時發生錯誤: {e}")
+                    logger.debug("清理舊引擎時發生錯誤: %s", e)
                 finally:
                     self.engine = None
             
@@ -132,24 +277,25 @@ class CantoneseAudioManagerFixed:
             time.sleep(0.05)
             
             # 創建新引擎
-            assert pyttsx3 is not None
-            self.engine = pyttsx3.init()
+            self.engine = _get_pyttsx3().init()
             
             if not self.engine:
                 logger.error("創建 pyttsx3 引擎失敗")
                 return False
             
             # 重新設置所有屬性
-            self.engine.setProperty('rate', self.rate)
-            self.engine.setProperty('volume', self.volume)
+            rate, volume = self.rate, self.volume
+            self.engine.setProperty('rate', rate)
+            self.engine.setProperty('volume', volume)
+            self._applied_settings = {'rate': rate, 'volume': volume}
             
             # 重新設置粵語語音
             if self.voice_id:
                 try:
                     self.engine.setProperty('voice', self.voice_id)
-                    logger.debug(f"重新設置語音ID: {self.voice_id}")
+                    logger.debug("重新設置語音ID: %s", self.voice_id)
                 except Exception as e:
-                    logger.warning(f"設置語音ID失敗: {e}")
+                    logger.warning("設置語音ID失敗: %s", e)
                     # 嘗試重新查找語音
                     self._find_cantonese_voice()
             
@@ -157,7 +303,7 @@ class CantoneseAudioManagerFixed:
             return True
             
         except Exception as e:
-            logger.error(f"創建新語音引擎失敗: {e}")
+            logger.error("創建新語音引擎失敗: %s", e)
             self.engine = None
             return False
     
@@ -172,25 +318,45 @@ class CantoneseAudioManagerFixed:
                 return
             
             # 查找香港粵語語音 (Microsoft Tracy)
-            for voice in voices:
-                if voice and (('zh-HK' in str(voice.languages) if voice.languages else False) or
-                             ('HongKong' in voice.name if voice.name else False) or
-                             ('Tracy' in voice.name if voice.name else False)):
-                    self.voice_id = voice.id
-                    self.engine.setProperty('voice', voice.id)
-                    logger.debug(f"重新找到粵語語音: {voice.name}")
-                    break
+            voice = _find_cantonese_voice_in(voices)
+            if voice is not None:
+                self.voice_id = voice.id
+                self.engine.setProperty('voice', voice.id)
+                logger.debug("重新找到粵語語音: %s", voice.name)
         except Exception as e:
-            logger.warning(f"重新查找語音失敗: {e}")
+            logger.warning("重新查找語音失敗: %s", e)
     
     def _initialize_audio_system(self):
         """初始化 pygame 音訊系統"""
         try:
-            pygame.mixer.init(frequency=22050, size=-16, channels=2, buffer=512)
+            _get_pygame()
+            # 混音器已由其他元件初始化時直接沿用，避免重複初始化
+            if pygame.mixer.get_init():
+                logger.debug("pygame混音器已初始化，沿用現有設定")
+            else:
+                # 先以pre_init記錄參數，確保其他模組隱式初始化時沿用相同設定
+                pygame.mixer.pre_init(
+                    frequency=SystemConfig.AUDIO_FREQUENCY,
+                    size=SystemConfig.AUDIO_SIZE,
+                    channels=SystemConfig.AUDIO_CHANNELS,
+                    buffer=SystemConfig.AUDIO_BUFFER
+                )
+                try:
+                    pygame.mixer.init()
+                except pygame.error as e:
+                    # 部分音效裝置不接受指定參數，改用SDL預設設定
+                    logger.warning("以指定參數初始化混音器失敗，改用預設設定: %s", e)
+                    pygame.mixer.pre_init()
+                    pygame.mixer.init()
             pygame.mixer.music.set_volume(self.volume)
+            
+            # 保留0號聲道專供語音使用，避免被其他音效以find_channel佔用
+            pygame.mixer.set_reserved(1)
+            self._speech_channel = pygame.mixer.Channel(0)
+            
             logger.info("pygame音訊系統初始化成功")
         except Exception as e:
-            logger.error(f"pygame音訊系統初始化失敗: {e}")
+            logger.error("pygame音訊系統初始化失敗: %s", e)
     
     def _pregenerate_common_sounds(self):
         """預生成常用語音檔案"""
@@ -200,27 +366,101 @@ class CantoneseAudioManagerFixed:
             
         logger.info("開始預生成語音檔案...")
         
+        # 去除重複文字（保留原有順序），已存在的檔案直接登記，不必派送
+        pending = []
+        for message in dict.fromkeys(self._iter_common_messages()):
+            filepath = self._find_existing_file(message)
+            if filepath:
+                self._mark_ready(filepath)
+                self._playable[message] = filepath
+            else:
+                pending.append(message)
+        
+        # gTTS為網路I/O密集，使用線程池並行生成
+        if pending:
+            with ThreadPoolExecutor(max_workers=SystemConfig.TTS_PREGENERATE_WORKERS) as executor:
+                list(executor.map(self._generate_audio_file, pending))
+        
+        # 預先載入Sound物件
+        for filepath in list(self._playable.values()):
+            self._get_sound(filepath)
+        
+        logger.info("語音檔案預生成完成")
+    
+    @staticmethod
+    def _iter_common_messages() -> Iterator[str]:
+        """依序產生需要預生成的常用訊息（不建立中間列表）"""
         # 常用訊息
-        common_messages = [
-            Messages.SYSTEM_START,
-            Messages.CALIBRATION_START,
-            Messages.CALIBRATION_SUCCESS,
-            Messages.CALIBRATION_FAILED,
-        ]
+        yield Messages.SYSTEM_START
+        yield Messages.CALIBRATION_START
+        yield Messages.CALIBRATION_SUCCESS
+        yield Messages.CALIBRATION_FAILED
         
-        # 預生成動作說明
-        for action, message in Messages.ACTION_INSTRUCTIONS.items():
-            common_messages.append(message)
+        # 動作說明
+        yield from Messages.ACTION_INSTRUCTIONS.values()
         
-        # 預生成動作成功訊息
-        for action, message in Messages.ACTION_SUCCESS.items():
-            common_messages.append(message)
+        # 動作成功訊息
+        yield from Messages.ACTION_SUCCESS.values()
+    
+    def _pregenerate_local_sounds(self):
+        """以本地引擎預生成常用語音檔案（僅在語音線程中呼叫，無需網路）"""
+        logger.info("開始以本地引擎預生成語音檔案...")
         
-        # 生成音訊檔案
-        for message in common_messages:
-            self._generate_audio_file(message)
+        for message in dict.fromkeys(self._iter_common_messages()):
+            filepath = self._generate_audio_file_local(message)
+            if filepath:
+                self._get_sound(filepath)
         
-        logger.info("語音檔案預生成完成")
+        logger.info("本地語音檔案預生成完成")
+    
+    def _generate_audio_file_local(self, text: str) -> Optional[str]:
+        """
+        以本地引擎將文字輸出為WAV檔案（僅在語音線程中呼叫）
+        
+        Args:
+            text: 語音文字
+            
+        Returns:
+            Optional[str]: 語音檔案路徑，生成失敗時為None
+        """
+        if not self.engine and not self._speech_proc:
+            return None
+        
+        filepath = _audio_path_for(text, local=True)
+        if self._is_valid_file(filepath):
+            self._mark_ready(filepath)
+            return filepath
+        
+        tmp_path = filepath + '.tmp'
+        try:
+            if self._speech_proc:
+                if not self._send_to_process(SpeechCmd('save', (text, tmp_path))):
+                    raise RuntimeError("語音子程序輸出失敗")
+            else:
+                self.engine.save_to_file(text, tmp_path)
+                self.engine.runAndWait()
+            os.replace(tmp_path, filepath)
+        except Exception as e:
+            logger.error("本地生成語音檔案失敗 '%s': %s", text, e)
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            return None
+        
+        if not self._is_valid_file(filepath):
+            return None
+        
+        self._mark_ready(filepath)
+        logger.info("語音檔案已生成: %s", filepath)
+        return filepath
+    
+    def _get_local_file(self, text: str) -> Optional[str]:
+        """獲取本地引擎預生成的語音檔案，不存在或混音器未啟用時為None"""
+        filepath = _audio_path_for(text, local=True)
+        if filepath in self._ready_files and _mixer_ready():
+            return filepath
+        return None
     
     def _generate_audio_file(self, text: str) -> Optional[str]:
         """生成音訊檔案"""
@@ -228,26 +468,231 @@ class CantoneseAudioManagerFixed:
             return None
             
         try:
-            # 生成檔案名
-            text_hash = hashlib.md5(text.encode()).hexdigest()[:8]
-            filename = f"voice_{text_hash}.{SystemConfig.SOUND_FORMAT}"
-            filepath = self.sound_dir / filename
-            
-            # 如果檔案已存在，直接返回
-            if filepath.exists():
-                return str(filepath)
+            mp3_path = _audio_path_for(text)
+            with self._get_path_lock(mp3_path):
+                # 如果檔案已存在（或等待鎖期間已由其他線程生成），直接返回
+                filepath = self._find_existing_file(text)
+                if filepath:
+                    self._mark_ready(filepath)
+                    self._playable[text] = filepath
+                    return filepath
+                
+                # 中斷寫入留下的空檔案視為不存在
+                if not self._is_valid_file(mp3_path):
+                    # 先寫入暫存檔再原子替換，中途中斷不會留下不完整的語音檔案
+                    tts = _get_gtts()(text=text, lang='zh-TW', slow=SystemConfig.TTS_SLOW)
+                    tmp_path = mp3_path + '.tmp'
+                    try:
+                        with open(tmp_path, 'wb') as fp:
+                            tts.write_to_fp(fp)
+                            fp.flush()
+                            os.fsync(fp.fileno())
+                        os.replace(tmp_path, mp3_path)
+                    except BaseException:
+                        try:
+                            os.unlink(tmp_path)
+                        except OSError:
+                            pass
+                        raise
+                    logger.info("語音檔案已生成: %s", mp3_path)
+                self._mark_ready(mp3_path)
+                
+                filepath = self._transcode_to_wav(mp3_path) if self._ffmpeg_path else mp3_path
+                self._mark_ready(filepath)
+                self._playable[text] = filepath
+                return filepath
             
-            # 生成語音檔案
-            if gTTSClass:
-                tts = gTTSClass(text=text, lang='zh-TW', slow=SystemConfig.TTS_SLOW)
-                tts.save(str(filepath))
+        except Exception as e:
+            logger.error("生成語音檔案失敗 '%s': %s", text, e)
+            return None
+    
+    def _get_path_lock(self, filepath: str) -> threading.Lock:
+        """獲取指定檔案路徑的生成鎖"""
+        with self._path_locks_guard:
+            lock = self._path_locks.get(filepath)
+            if lock is None:
+                lock = self._path_locks[filepath] = threading.Lock()
+            return lock
+    
+    def _find_existing_file(self, text: str) -> Optional[str]:
+        """
+        查找已生成且可直接播放的gTTS語音檔案
+        
+        Args:
+            text: 語音文字
             
-            logger.info(f"語音檔案已生成: {filepath}")
-            return str(filepath)
+        Returns:
+            Optional[str]: 語音檔案路徑；不存在或仍需轉換為WAV時為None
+        """
+        mp3_path = _audio_path_for(text)
+        if self._ffmpeg_path:
+            wav_path = os.path.splitext(mp3_path)[0] + '.wav'
+            return wav_path if self._is_valid_file(wav_path) else None
+        return mp3_path if self._is_valid_file(mp3_path) else None
+    
+    def _transcode_to_wav(self, mp3_path: str) -> str:
+        """
+        將MP3轉為混音器取樣率的16位元PCM WAV（只需轉換一次）
+        
+        Args:
+            mp3_path: MP3檔案路徑
             
+        Returns:
+            str: WAV檔案路徑，轉換失敗時返回原MP3路徑
+        """
+        wav_path = os.path.splitext(mp3_path)[0] + '.wav'
+        tmp_path = wav_path + '.tmp'
+        
+        try:
+            subprocess.run(
+                [self._ffmpeg_path, '-y', '-loglevel', 'error', '-i', mp3_path,
+                 '-ar', str(SystemConfig.AUDIO_FREQUENCY),
+                 '-ac', str(SystemConfig.AUDIO_CHANNELS),
+                 '-acodec', 'pcm_s16le', '-f', 'wav', tmp_path],
+                capture_output=True,
+                check=True,
+                timeout=SystemConfig.FFMPEG_TIMEOUT
+            )
+            os.replace(tmp_path, wav_path)
         except Exception as e:
-            logger.error(f"生成語音檔案失敗 '{text}': {e}")
-            return None
+            logger.warning("轉換WAV失敗，改用MP3: %s, 錯誤: %s", mp3_path, e)
+            # 移除可能殘留的不完整檔案
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+            return mp3_path
+        
+        logger.debug("已轉換為WAV: %s", wav_path)
+        return wav_path
+    
+    def _sweep_worker(self):
+        """語音目錄清理線程"""
+        while not self._sweep_stop.wait(SystemConfig.SOUND_CACHE_SWEEP_INTERVAL):
+            self._sweep_sound_dir()
+    
+    def _sweep_sound_dir(self):
+        """刪除本管理器產生的空檔案、殘留的暫存檔及過期未使用的語音檔案"""
+        now = time.time()
+        removed = set()
+        
+        # 常用提示與完整動作說明（含版本庫中追蹤的語音檔案）不論是否過期都保留
+        keep = set()
+        for message in (*self._iter_common_messages(), Messages.get_all_instructions()):
+            mp3_path = _audio_path_for(message)
+            keep.update((mp3_path, os.path.splitext(mp3_path)[0] + '.wav',
+                         _audio_path_for(message, local=True)))
+        
+        try:
+            entries = list(os.scandir(self.sound_dir))
+        except OSError as e:
+            logger.warning("無法掃描語音目錄: %s", e)
+            return
+        
+        for entry in entries:
+            if not _OWN_SOUND_RE.fullmatch(entry.name) or not entry.is_file():
+                continue
+            try:
+                stat = entry.stat()
+                age = now - stat.st_mtime
+                # 空檔案與暫存檔可能仍在寫入中，超過一個清理週期才視為中斷寫入的殘留
+                # 檢查與刪除在同一把鎖內完成，期間其他線程無法將該檔案登記為使用中
+                with self._cache_lock:
+                    if stat.st_size == 0 or entry.name.endswith('.tmp'):
+                        expired = age > SystemConfig.SOUND_CACHE_SWEEP_INTERVAL
+                    else:
+                        # 本次執行中使用中的檔案不清除
+                        expired = (entry.path not in keep and entry.path not in self._ready_files
+                                   and age > SystemConfig.SOUND_CACHE_TTL)
+                    if expired:
+                        os.unlink(entry.path)
+                        self._ready_files.discard(entry.path)
+                        self._sound_cache.pop(entry.path, None)
+                        removed.add(entry.path)
+            except OSError as e:
+                logger.debug("清理語音檔案失敗 %s: %s", entry.path, e)
+        
+        if removed:
+            # 預取與預生成線程可能同時加入新項目，只移除對應已刪除檔案的項目（以快照迭代）
+            for text, path in list(self._playable.items()):
+                if path in removed:
+                    self._playable.pop(text, None)
+            logger.info("已清理 %s 個語音檔案", len(removed))
+    
+    def _mark_ready(self, filepath: str):
+        """登記已確認存在的語音檔案"""
+        with self._cache_lock:
+            self._ready_files.add(filepath)
+    
+    def _get_sound(self, filepath: str) -> Optional[Any]:
+        """
+        獲取快取的Sound物件，首次使用時載入
+        
+        Args:
+            filepath: 語音檔案路徑
+            
+        Returns:
+            Optional[pygame.mixer.Sound]: Sound物件，載入失敗時為None
+        """
+        sound = self._sound_cache.get(filepath)
+        if sound is None:
+            try:
+                sound = pygame.mixer.Sound(filepath)
+                sound.set_volume(self.volume)
+            except Exception as e:
+                logger.debug("載入Sound失敗，改用music串流: %s", e)
+                return None
+            # 其他線程可能已同時載入同一檔案，沿用先放入快取的物件
+            with self._cache_lock:
+                sound = self._sound_cache.setdefault(filepath, sound)
+        return sound
+    
+    def _play_file(self, filepath: str):
+        """
+        播放語音檔案，優先使用快取的Sound物件（僅在語音線程中呼叫）
+        
+        語音線程逐段播放並等待播放完成，待播語音的先後順序由語音佇列保存，
+        不使用只能保留一段待播語音的聲道佇列，連續的提示不會互相取代
+        
+        Args:
+            filepath: 語音檔案路徑
+            
+        Returns:
+            Optional[pygame.mixer.Channel]: 播放所用的聲道，使用music串流時為None
+        """
+        self._playback_done.clear()
+        
+        sound = self._get_sound(filepath)
+        if sound is not None:
+            channel = self._speech_channel
+            if channel is None:
+                return sound.play()
+            channel.play(sound)
+            return channel
+        
+        pygame.mixer.music.load(filepath)
+        pygame.mixer.music.play()
+        return None
+    
+    @staticmethod
+    def _is_valid_file(filepath: str) -> bool:
+        """檢查語音檔案是否存在且非空檔案"""
+        try:
+            return os.path.getsize(filepath) > 0
+        except OSError:
+            return False
+    
+    def _resolve_audio_path(self, text: str) -> Optional[str]:
+        """
+        取得可播放的語音檔案路徑，必要時即時生成
+        
+        Args:
+            text: 語音文字
+            
+        Returns:
+            Optional[str]: 語音檔案路徑，生成失敗時為None
+        """
+        return self._playable.get(text) or self._generate_audio_file(text)
     
     def speak(self, text: str) -> bool:
         """
@@ -267,100 +712,310 @@ class CantoneseAudioManagerFixed:
             logger.warning("空的語音文字")
             return False
         
-        # 檢查是否正在播放
-        if self.is_speaking:
-            logger.debug("語音正在播放中，跳過新請求")
+        logger.info("開始語音播放: %s%s", text[:50], '...' if len(text) > 50 else '')
+        
+        return self._enqueue_speech(text)
+    
+    def _enqueue_speech(self, text: str) -> bool:
+        """將語音加入播放佇列，由語音線程播放，不阻塞呼叫者"""
+        # 偵測流程可能連續多幀發出相同提示，短時間內的重複請求直接略過
+        last_text, last_time = self._last_enqueue
+        now = time.monotonic()
+        if text == last_text and now - last_time < SystemConfig.AUDIO_DUPLICATE_TTL:
+            logger.debug("相同語音剛加入佇列，跳過")
             return False
         
-        logger.info(f"開始語音播放: {text[:50]}{'...' if len(text) > 50 else ''}")
+        # 已備妥檔案的提示亦交由語音線程播放，與仍需生成或由引擎朗讀的語音依請求順序輪流，
+        # 不會重疊或插隊；gTTS模式下同時在背景預先生成下一句可能的語音
+        ready_file = self._get_ready_file(text)
+        if ready_file and not self.use_local_voice:
+            self._prefetch_next(text)
         
+        # 待播語音已達上限時捨棄最舊的語音，保留最新的提示
+        cmd = SpeechCmd('play', ready_file) if ready_file else SpeechCmd('speak', text)
+        speech_queue = self._speech_queue
+        with speech_queue.mutex:
+            pending = sum(1 for queued in speech_queue.queue
+                          if queued is not None and queued.kind in _SPEECH_KINDS)
+        if pending >= SystemConfig.SPEECH_QUEUE_MAX:
+            self._drop_oldest_speech()
+        speech_queue.put_nowait(cmd)
+        
+        self._last_enqueue = (text, now)
+        return True
+    
+    def _get_ready_file(self, text: str) -> Optional[str]:
+        """獲取可立即播放的語音檔案，尚未生成或混音器未啟用時為None"""
         if self.use_local_voice:
-            return self._speak_local_safe(text)
+            return self._get_local_file(text)
+        
+        filepath = self._playable.get(text)
+        if filepath and _mixer_ready():
+            return filepath
+        return None
+    
+    def _drop_oldest_speech(self):
+        """捨棄佇列中最舊的一段待播語音（控制指令不受影響）"""
+        speech_queue = self._speech_queue
+        with speech_queue.mutex:
+            for cmd in speech_queue.queue:
+                if cmd is not None and cmd.kind in _SPEECH_KINDS:
+                    speech_queue.queue.remove(cmd)
+                    speech_queue.unfinished_tasks -= 1
+                    speech_queue.not_full.notify()
+                    logger.debug("語音佇列已滿，捨棄最舊的語音: %s", cmd.payload)
+                    return
+    
+    def _speech_worker(self):
+        """語音播放線程，阻塞等待佇列直到收到停止訊號"""
+        if self.use_local_voice:
+            self._start_local_engine()
+        
+        while True:
+            cmd = self._speech_queue.get()
+            try:
+                if cmd is None:
+                    break
+                self._handle_speech_cmd(cmd)
+            except Exception as e:
+                logger.error("處理語音指令失敗 %s: %s", cmd.kind, e)
+            finally:
+                self._speech_queue.task_done()
+        
+        # 子程序與引擎由本線程擁有，亦由本線程釋放
+        self._stop_speech_process()
+        if self.engine:
+            try:
+                self.engine.stop()
+            except Exception:
+                pass
+            finally:
+                self.engine = None
+    
+    def _start_local_engine(self):
+        """啟動本地語音引擎並預生成常用提示（僅在語音線程中呼叫）"""
+        # 優先交由子程序驅動pyttsx3；否則引擎需在呼叫runAndWait的同一線程建立，
+        # 並在整個生命週期內沿用
+        if SystemConfig.LOCAL_TTS_SUBPROCESS and self._start_speech_process():
+            self.engine = None  # 偵測語音時建立的引擎已不再需要
+            logger.info("本地語音改由子程序播放")
+        elif not self._create_fresh_engine():
+            logger.error("無法創建語音引擎")
+        
+        if (self._speech_proc or self.engine) and \
+                SystemConfig.LOCAL_TTS_PREGENERATE and _mixer_ready():
+            self._pregenerate_local_sounds()
+    
+    def _handle_speech_cmd(self, cmd: SpeechCmd):
+        """在語音線程中執行單一語音指令"""
+        if cmd.kind == 'speak':
+            if self.use_local_voice:
+                self._last_speech_ok = self._speak_local_safe(cmd.payload)
+            else:
+                self._last_speech_ok = self._speak_gtts_blocking(cmd.payload)
+        elif cmd.kind == 'play':
+            self._last_speech_ok = False
+            self._wait_for_playback(self._play_file(cmd.payload))
+            self._last_speech_ok = True
+        elif cmd.kind == 'settings':
+            self._apply_settings()
+        elif self._speech_proc:
+            self._send_to_process(cmd)
+        elif self.engine and cmd.kind == 'stop':
+            self.engine.stop()
+    
+    def _apply_settings(self):
+        """將最新的音量與語速套用到引擎，數值未變時不呼叫引擎（僅在語音線程中呼叫）"""
+        with self._settings_lock:
+            self._settings_pending = False
+        
+        for kind, value in (('volume', self.volume), ('rate', self.rate)):
+            if self._applied_settings.get(kind) == value:
+                continue
+            if self._speech_proc:
+                if not self._send_to_process(SpeechCmd(kind, value)):
+                    continue
+            elif self.engine:
+                self.engine.setProperty(kind, value)
+            else:
+                continue
+            self._applied_settings[kind] = value
+    
+    def _request_settings_apply(self):
+        """
+        通知語音線程套用最新設定
+        
+        連續拖動滑桿時只保留一個待處理的套用指令，語音線程處理時讀取當下的最新數值
+        """
+        with self._settings_lock:
+            if self._settings_pending:
+                return
+            self._settings_pending = True
+        
+        self._post_speech_cmd('settings')
+    
+    def _start_speech_process(self) -> bool:
+        """
+        啟動本地語音子程序並同步語速、音量與語音設定（僅在語音線程中呼叫）
+        
+        Returns:
+            bool: 是否成功啟動
+        """
+        try:
+            proc = subprocess.Popen(
+                [sys.executable, SPEECH_WORKER_SCRIPT],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                encoding='utf-8',
+                bufsize=1
+            )
+        except OSError as e:
+            logger.warning("無法啟動語音子程序: %s", e)
+            return False
+        
+        self._speech_proc = proc
+        self._proc_replies = queue.Queue()
+        reader = threading.Thread(target=self._read_speech_replies,
+                                  args=(proc, self._proc_replies), daemon=True)
+        reader.start()
+        
+        reply = self._await_reply()
+        if reply != 'ready':
+            logger.warning("語音子程序初始化失敗: %s", reply)
+            self._stop_speech_process()
+            return False
+        
+        self._applied_settings = {}
+        for kind, payload in (('rate', self.rate), ('volume', self.volume), ('voice', self.voice_id)):
+            if payload is None:
+                continue
+            if self._exchange(SpeechCmd(kind, payload)) == 'ok':
+                self._applied_settings[kind] = payload
+            else:
+                logger.warning("語音子程序設定%s失敗", kind)
+        return True
+    
+    @staticmethod
+    def _read_speech_replies(proc: subprocess.Popen, replies: queue.Queue):
+        """讀取語音子程序回覆的線程，子程序結束時放入None"""
+        try:
+            for line in proc.stdout:
+                replies.put(line.strip())
+        except (OSError, ValueError):
+            pass
+        replies.put(None)
+    
+    def _await_reply(self) -> Optional[str]:
+        """等待語音子程序回覆，逾時或子程序結束時為None"""
+        try:
+            return self._proc_replies.get(timeout=SystemConfig.LOCAL_TTS_TIMEOUT)
+        except queue.Empty:
+            return None
+    
+    def _exchange(self, cmd: SpeechCmd) -> Optional[str]:
+        """傳送指令給語音子程序並等待回覆"""
+        proc = self._speech_proc
+        if proc is None or proc.stdin is None:
+            return None
+        
+        try:
+            proc.stdin.write(json.dumps(cmd._asdict(), ensure_ascii=False) + '\n')
+            proc.stdin.flush()
+        except (OSError, ValueError):
+            return None
+        return self._await_reply()
+    
+    def _send_to_process(self, cmd: SpeechCmd) -> bool:
+        """
+        由語音子程序執行指令，子程序卡死或結束時重新啟動
+        
+        Args:
+            cmd: 語音指令
+            
+        Returns:
+            bool: 指令是否執行成功
+        """
+        reply = self._exchange(cmd)
+        if reply == 'ok':
+            return True
+        
+        if reply is None:
+            if self._speech_interrupted:
+                self._speech_interrupted = False
+                logger.info("語音已中斷，重新啟動語音子程序")
+            else:
+                logger.warning("語音子程序無回應，重新啟動")
+            self._stop_speech_process()
+            self._start_speech_process()
         else:
-            return self._speak_gtts(text)
+            logger.error("語音子程序執行失敗 %s: %s", cmd.kind, reply)
+        return False
+    
+    def _stop_speech_process(self):
+        """關閉語音子程序，未能及時結束時強制終止"""
+        proc, self._speech_proc = self._speech_proc, None
+        if proc is None:
+            return
+        
+        try:
+            proc.stdin.close()
+        except OSError:
+            pass
+        try:
+            proc.wait(timeout=2.0)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+            proc.wait()
+    
+    def _post_speech_cmd(self, kind: str, payload: Any = None):
+        """傳送控制指令給語音線程（控制指令不受去重與待播語音上限限制，不會阻塞呼叫者）"""
+        self._speech_queue.put_nowait(SpeechCmd(kind, payload))
     
     def _speak_local_safe(self, text: str) -> bool:
-        """線程安全的本地語音播放"""
+        """本地語音播放（僅在語音線程中呼叫）"""
         if not self.use_local_voice:
             return False
         
-        with self._engine_lock:
+        if self._speech_proc:
+            logger.info("播放粵語語音: %s", text)
+            self.is_speaking = True
             try:
-                # 每次播放前重新創建引擎
-                if not self._create_fresh_engine():
-                    logger.error("無法創建語音引擎")
-                    return False
-                
-                assert self.engine is not None
-                logger.info(f"播放粵語語音: {text}")
-                
-                # 設置播放狀態
-                self.is_speaking = True
-                
-                # 使用同步播放，確保完成
-                self.engine.say(text)
-                self.engine.runAndWait()
-                
-                # 確保播放完成
-                import time
-                time.sleep(0.1)  # 稍微等待確保播放完成
-                
-                # 播放完成後清理
-                self.is_speaking = False
-                
-                logger.debug(f"語音播放完成: {text}")
-                return True
-                
-            except Exception as e:
-                logger.error(f"本地語音播放失敗: {e}")
+                return self._send_to_process(SpeechCmd('speak', text))
+            finally:
                 self.is_speaking = False
-                
-                # 嘗試重新創建引擎
-                try:
-                    self._create_fresh_engine()
-                except:
-                    pass
-                    
-                return False
-    
-    def _speak_gtts(self, text: str) -> bool:
-        """使用 gTTS 播放語音"""
-        if not GTTS_AVAILABLE:
-            return False
         
         try:
-            # 嘗試使用預生成的檔案
-            text_hash = hashlib.md5(text.encode()).hexdigest()[:8]
-            filename = f"voice_{text_hash}.{SystemConfig.SOUND_FORMAT}"
-            filepath = self.sound_dir / filename
-            
-            if not filepath.exists():
-                # 即時生成語音檔案
-                filepath = self._generate_audio_file(text)
-                if not filepath:
-                    return False
-            
-            # 播放音訊檔案
-            def play_thread():
-                try:
-                    pygame.mixer.music.load(str(filepath))
-                    pygame.mixer.music.play()
-                    
-                    # 等待播放完成
-                    while pygame.mixer.music.get_busy():
-                        time.sleep(0.1)
-                        
-                except Exception as e:
-                    logger.error(f"播放音訊檔案失敗: {e}")
+            # 沿用語音線程的常駐引擎，僅在引擎遺失時重建
+            if self.engine is None and not self._create_fresh_engine():
+                logger.error("無法創建語音引擎")
+                return False
+            
+            assert self.engine is not None
+            logger.info("播放粵語語音: %s", text)
+            
+            # 設置播放狀態
+            self.is_speaking = True
             
-            thread = threading.Thread(target=play_thread, daemon=True)
-            thread.start()
+            # 使用同步播放，runAndWait返回時即已播放完成
+            self.engine.say(text)
+            self.engine.runAndWait()
             
-            logger.info(f"播放語音檔案: {text}")
+            # 播放完成後清理
+            self.is_speaking = False
+            
+            logger.debug("語音播放完成: %s", text)
             return True
             
         except Exception as e:
-            logger.error(f"gTTS語音播放失敗: {e}")
+            logger.error("本地語音播放失敗: %s", e)
+            self.is_speaking = False
+            
+            # 播放失敗時才重新創建引擎
+            try:
+                self._create_fresh_engine()
+            except:
+                pass
+                
             return False
     
     def speak_blocking(self, text: str) -> bool:
@@ -376,46 +1031,105 @@ class CantoneseAudioManagerFixed:
         if not self.is_enabled:
             return False
         
-        if self.use_local_voice:
-            return self._speak_local_safe(text)  # 本地語音本身就是阻塞的
-        else:
-            return self._speak_gtts_blocking(text)
+        # 與speak()相同經由語音線程依序播放，等待佇列播放完畢，不與其他語音重疊
+        if not self._enqueue_speech(text):
+            return False
+        self._speech_queue.join()
+        return self._last_speech_ok
     
     def _speak_gtts_blocking(self, text: str) -> bool:
-        """阻塞式 gTTS 語音播放"""
+        """阻塞式 gTTS 語音播放（僅在語音線程中呼叫）"""
         if not GTTS_AVAILABLE:
             return False
         
         try:
             # 生成或獲取音訊檔案
-            text_hash = hashlib.md5(text.encode()).hexdigest()[:8]
-            filename = f"voice_{text_hash}.{SystemConfig.SOUND_FORMAT}"
-            filepath = self.sound_dir / filename
-            
-            if not filepath.exists():
-                filepath = self._generate_audio_file(text)
-                if not filepath:
-                    return False
+            filepath = self._resolve_audio_path(text)
+            if not filepath:
+                return False
             
-            # 播放音訊檔案
-            pygame.mixer.music.load(str(filepath))
-            pygame.mixer.music.play()
+            # 播放音訊檔案，播放期間在背景預先生成下一句可能的語音
+            channel = self._play_file(filepath)
+            self._prefetch_next(text)
             
             # 等待播放完成
-            while pygame.mixer.music.get_busy():
-                time.sleep(0.1)
+            self._wait_for_playback(channel)
             
-            logger.info(f"阻塞播放語音檔案: {text}")
+            logger.info("阻塞播放語音檔案: %s", text)
             return True
             
         except Exception as e:
-            logger.error(f"阻塞gTTS語音播放失敗: {e}")
+            logger.error("阻塞gTTS語音播放失敗: %s", e)
             return False
     
+    def prefetch(self, texts: Iterable[str]):
+        """
+        並行預先生成多句gTTS語音檔案（不播放），已生成的略過
+        
+        Args:
+            texts: 要預先生成的文字
+        """
+        if self.use_local_voice or not GTTS_AVAILABLE:
+            return
+        
+        pending = [text for text in dict.fromkeys(texts) if text not in self._playable]
+        if not pending:
+            return
+        
+        # gTTS為網路I/O密集，使用線程池並行生成後預先載入Sound物件
+        with ThreadPoolExecutor(max_workers=SystemConfig.TTS_PREGENERATE_WORKERS) as executor:
+            for filepath in executor.map(self._generate_audio_file, pending):
+                if filepath:
+                    self._get_sound(filepath)
+    
+    def _prefetch_next(self, text: str):
+        """
+        在背景生成下一句可能播放的語音，讓網路請求與目前的播放重疊
+        
+        Args:
+            text: 目前播放的語音文字
+        """
+        # 已在背景預取中或曾預取失敗的提示不再派送，避免離線時每次播放都啟動失敗的網路請求
+        with self._prefetch_lock:
+            hints = [hint for hint in Messages.get_next_hints(text)
+                     if hint not in self._playable and hint not in self._prefetch_claimed]
+            self._prefetch_claimed.update(hints)
+        if not hints:
+            return
+        
+        def prefetch():
+            for hint in hints:
+                filepath = self._generate_audio_file(hint)
+                if filepath:
+                    self._get_sound(filepath)
+                    # 成功後釋放，檔案日後被清理時可再次預取；失敗的提示保留，改在實際播放時生成
+                    with self._prefetch_lock:
+                        self._prefetch_claimed.discard(hint)
+        
+        threading.Thread(target=prefetch, daemon=True).start()
+    
+    def _wait_for_playback(self, channel):
+        """
+        等待播放完成
+        
+        以短間隔檢查聲道狀態，不使用SDL事件佇列：事件佇列需初始化video子系統，
+        且只能在初始化video的線程讀取，與Tk介面同時使用時並不可靠（macOS上無法運作）；
+        stop()會設置_playback_done讓等待立即結束
+        
+        Args:
+            channel: 播放所用的聲道，使用music串流時為None
+        """
+        def is_busy() -> bool:
+            return channel.get_busy() if channel else pygame.mixer.music.get_busy()
+        
+        while is_busy():
+            if self._playback_done.wait(SystemConfig.AUDIO_POLL_INTERVAL):
+                self._playback_done.clear()
+    
     def set_enabled(self, enabled: bool):
         """設置是否啟用語音"""
         self.is_enabled = enabled
-        logger.info(f"語音{'啟用' if enabled else '停用'}")
+        logger.info("語音%s", '啟用' if enabled else '停用')
     
     def is_voice_enabled(self) -> bool:
         """檢查語音是否啟用"""
@@ -429,18 +1143,24 @@ class CantoneseAudioManagerFixed:
             volume: 音量 (0.0-1.0)
         """
         try:
-            self.volume = max(0.0, min(1.0, volume))
+            volume = max(0.0, min(1.0, volume))
+            if abs(volume - self.volume) < 1e-3:
+                return
+            self.volume = volume
             
             if self.use_local_voice:
-                with self._engine_lock:
-                    if self.engine:
-                        self.engine.setProperty('volume', self.volume)
-            else:
+                self._request_settings_apply()
+            if _mixer_ready():
                 pygame.mixer.music.set_volume(self.volume)
+                # 以快照迭代，其他線程同時載入或清理Sound時不會中斷音量套用
+                with self._cache_lock:
+                    sounds = list(self._sound_cache.values())
+                for sound in sounds:
+                    sound.set_volume(self.volume)
             
-            logger.info(f"音量已設定為: {self.volume}")
+            logger.info("音量已設定為: %s", self.volume)
         except Exception as e:
-            logger.error(f"設置音量失敗: {e}")
+            logger.error("設置音量失敗: %s", e)
     
     def set_rate(self, rate: int):
         """
@@ -454,50 +1174,80 @@ class CantoneseAudioManagerFixed:
             return
             
         try:
-            self.rate = max(50, min(300, rate))
-            with self._engine_lock:
-                if self.engine:
-                    self.engine.setProperty('rate', self.rate)
-            logger.info(f"語速已設定為: {self.rate}")
+            rate = max(50, min(300, rate))
+            if rate == self.rate:
+                return
+            self.rate = rate
+            self._request_settings_apply()
+            logger.info("語速已設定為: %s", self.rate)
         except Exception as e:
-            logger.error(f"設置語速失敗: {e}")
+            logger.error("設置語速失敗: %s", e)
     
     def stop(self):
         """停止語音播放"""
         try:
+            self._clear_speech_queue()
+            
             if self.use_local_voice:
-                with self._engine_lock:
-                    if self.engine:
-                        self.engine.stop()
-                        self.is_speaking = False
-            else:
+                proc = self._speech_proc
+                if proc is not None:
+                    # 子程序逐一處理指令，排入的'stop'要等目前的句子說完才會執行；
+                    # 直接結束正在朗讀的子程序即可中斷，語音線程隨即重新啟動子程序
+                    if self.is_speaking:
+                        self._speech_interrupted = True
+                        proc.kill()
+                else:
+                    # 同程序的引擎只能由語音線程操作，正在播放的句子由其自行結束
+                    self._post_speech_cmd('stop')
+            if _mixer_ready():
                 pygame.mixer.music.stop()
+                pygame.mixer.stop()
+                self._playback_done.set()
             
             logger.info("語音播放已停止")
         except Exception as e:
-            logger.error(f"停止語音播放失敗: {e}")
+            logger.error("停止語音播放失敗: %s", e)
+    
+    def _clear_speech_queue(self):
+        """
+        清空語音佇列
+        
+        直接在佇列的互斥鎖內移除待播語音並扣除未完成計數，
+        而非逐項get_nowait()/task_done()；設定等控制指令保留不動，
+        語音線程正在播放的項目仍保留計數，由其自行task_done()
+        """
+        speech_queue = self._speech_queue
+        with speech_queue.mutex:
+            pending = speech_queue.queue
+            kept = [cmd for cmd in pending if cmd is None or cmd.kind not in _SPEECH_KINDS]
+            speech_queue.unfinished_tasks -= len(pending) - len(kept)
+            pending.clear()
+            pending.extend(kept)
+            if speech_queue.unfinished_tasks == 0:
+                speech_queue.all_tasks_done.notify_all()
+            speech_queue.not_full.notify_all()
     
     def cleanup(self):
         """清理資源"""
         try:
             self.stop()
+            self._sweep_stop.set()
             
-            with self._engine_lock:
-                if self.use_local_voice and self.engine:
-                    try:
-                        self.engine.stop()
-                        del self.engine
-                    except:
-                        pass
-                    finally:
-                        self.engine = None
-                else:
-                    pygame.mixer.quit()
+            # 停止本地語音線程（引擎由語音線程自行釋放）
+            if self._speech_thread and self._speech_thread.is_alive():
+                self._speech_queue.put_nowait(None)
+                self._speech_thread.join(timeout=2.0)
+            
+            if _mixer_ready():
+                with self._cache_lock:
+                    self._sound_cache.clear()
+                self._speech_channel = None
+                pygame.mixer.quit()
             
             self.is_speaking = False
             logger.info("粵語音訊管理器已清理")
         except Exception as e:
-            logger.error(f"清理音訊管理器失敗: {e}")
+            logger.error("清理音訊管理器失敗: %s", e)
     
     @property
     def is_initialized(self) -> bool:
@@ -505,7 +1255,7 @@ class CantoneseAudioManagerFixed:
         if self.use_local_voice:
             return PYTTSX3_AVAILABLE
         else:
-            return pygame.mixer.get_init() is not None
+            return _mixer_ready()
     
     def play_calibration_instruction(self):
         """播放校準指導語音"""
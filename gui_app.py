@@ -5,10 +5,11 @@ GUI應用模組
 
 import tkinter as tk
 from tkinter import ttk, messagebox
+import logging
 import threading
+import queue
 import time
 import cv2
-from PIL import Image, ImageTk
 import numpy as np
 from typing import Optional, Dict, List
 
@@ -16,14 +17,20 @@ from messages import Messages, SystemConfig
 from utils import logger, keyboard_sim, system_monitor, get_timestamp
 from pose_detector import PoseDetector, CameraManager
 from audio_manager_cantonese_fixed import CantoneseAudioManagerFixed
-from audio_manager import voice_instruction_manager
+from audio_manager import stop_voice_instructions
 
 
 class PoseDetectionGUI:
     """姿勢檢測GUI主應用"""
     
-    def __init__(self, audio_manager=None):
-        """初始化GUI應用"""
+    def __init__(self, audio_manager=None, use_gpu: bool = False):
+        """
+        初始化GUI應用
+        
+        Args:
+            audio_manager: 共用的音訊管理器，未提供時自行創建
+            use_gpu: 姿勢模型是否使用GPU委派
+        """
         self.root = tk.Tk()
         self.setup_window()
         
@@ -37,7 +44,7 @@ class PoseDetectionGUI:
             logger.info("創建新的音訊管理器")
         
         # 核心組件
-        self.pose_detector = PoseDetector()
+        self.pose_detector = PoseDetector(use_gpu=use_gpu)
         self.camera_manager = CameraManager()
         
         # 狀態變數（需要在setup_widgets之前初始化）
@@ -46,13 +53,21 @@ class PoseDetectionGUI:
         self.last_action = ""
         self.last_key = ""
         
+        # 勾選狀態的普通字典副本（由Tk變數的寫入追蹤同步），檢測線程讀取時不經Tk
+        self._flag_cache: Dict[str, bool] = {}
+        
         # 動作啟用狀態
         self.action_enabled = {}
         for action in Messages.ACTION_KEYS.keys():
             self.action_enabled[action] = tk.BooleanVar(value=True)
+            self._cache_flag(action, self.action_enabled[action])
+        
+        # 動作 -> (按鍵, 成功訊息)，觸發時免去逐次查表
+        self._action_targets = Messages.ACTION_LOOKUP
         
         # 語音模式
         self.voice_enabled = tk.BooleanVar(value=True)
+        self._cache_flag('voice', self.voice_enabled)
         
         # GUI組件（在變數初始化後設定）
         self.setup_widgets()
@@ -60,13 +75,52 @@ class PoseDetectionGUI:
         # 運行線程
         self.detection_thread = None
         self.gui_update_thread = None
+        self.convert_thread = None
+        
+        # 檢測線程 -> 轉換線程的單格佇列，轉換不及時丟棄舊幀
+        self._frame_queue = queue.Queue(maxsize=1)
+        # 轉換線程備妥的最新畫面 (尺寸, PPM資料) 與Tk已顯示的畫面
+        self._ready_frame = None
+        self._shown_frame = None
         
-        # 初始化圖像引用
+        # 初始化圖像引用（重用同一PhotoImage，尺寸改變時才重新建立）
         self.current_photo = None
+        self._photo_size = None
+        # 縮放與色彩轉換的重用緩衝區及PPM檔頭（依顯示尺寸配置）
+        self._resize_buf = None
+        self._rgb_buf = None
+        self._ppm_header = b''
+        self._buf_size = None
+        # 顯示尺寸緩存：只在視窗尺寸或攝影機解析度改變時重新計算
+        self._target_key = None
+        self._target_size = None
+        self._target_interp = None
         
         # 優化：緩存視窗大小以減少重複計算
+        # （僅在<Configure>事件後重新讀取，不在每幀查詢）
         self.cached_widget_size = (640, 480)
-        self.size_update_counter = 0
+        self._size_refresh_job = None
+        
+        # 優化：記錄各狀態標籤目前顯示的文字，內容未變時不呼叫config
+        self._label_texts: Dict[str, str] = {}
+        # 按鍵顯示恢復的after排程，連續觸發時只保留最後一個
+        self._key_restore_job = None
+        # 檢測線程送出的按鍵（不直接呼叫Tk），由狀態更新循環取出後才更新按鍵顯示
+        self._key_events: queue.SimpleQueue = queue.SimpleQueue()
+    
+    def _cache_flag(self, key: str, var: tk.BooleanVar):
+        """
+        將勾選變數的值同步到旗標緩存
+        
+        Args:
+            key: 旗標名稱
+            var: 對應的Tk布林變數
+        """
+        def on_write(*_):
+            self._flag_cache[key] = var.get()
+        
+        self._flag_cache[key] = var.get()
+        var.trace_add('write', on_write)
     
     def setup_window(self):
         """設定主視窗"""
@@ -229,11 +283,18 @@ class PoseDetectionGUI:
                 messagebox.showerror("錯誤", "無法開啟攝影機")
                 return
             
+            # 預熱影像轉換與顯示路徑，避免第一幀時才載入而卡頓
+            self._warmup_video_path()
+            
             # 啟動檢測線程
             self.is_running = True
             self.detection_thread = threading.Thread(target=self.detection_worker, daemon=True)
             self.detection_thread.start()
             
+            # 啟動影像轉換線程
+            self.convert_thread = threading.Thread(target=self.convert_worker, daemon=True)
+            self.convert_thread.start()
+            
             # 啟動GUI更新（使用after方法而非線程）
             self.gui_update_worker()
             
@@ -250,6 +311,20 @@ class PoseDetectionGUI:
             messagebox.showerror("錯誤", f"啟動系統時發生錯誤: {e}")
             logger.error(f"啟動系統失敗: {e}")
     
+    def _warmup_video_path(self):
+        """以黑色畫面預先走一次縮放、色彩轉換與PhotoImage建立，配置好重用緩衝區"""
+        try:
+            width, height = SystemConfig.CAMERA_WIDTH, SystemConfig.CAMERA_HEIGHT
+            cap = self.camera_manager.cap
+            if cap is not None:
+                width = int(cap.get(cv2.CAP_PROP_FRAME_WIDTH)) or width
+                height = int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT)) or height
+            
+            self.convert_frame(np.zeros((height, width, 3), dtype=np.uint8))
+            self.update_video_display()
+        except Exception as e:
+            logger.warning(f"影像顯示預熱失敗: {e}")
+    
     def stop_system(self):
         """停止系統"""
         self.is_running = False
@@ -257,17 +332,31 @@ class PoseDetectionGUI:
         # 等待線程結束
         if self.detection_thread:
             self.detection_thread.join(timeout=2.0)
+        if self.convert_thread:
+            self.convert_thread.join(timeout=2.0)
         
         # 關閉攝影機
         self.camera_manager.close_camera()
         
         # 停止語音指令循環
-        voice_instruction_manager.stop_continuous_instructions()
+        stop_voice_instructions()
         
         # 更新UI
         self.start_button.config(text=Messages.GUI_TEXTS['start_system'])
 
+        # 先解除標籤對圖像的引用再釋放PhotoImage，確保Tk圖像表中的項目被刪除
         self.video_label.config(image="", text="攝影機未啟動")
+        self.current_photo = None
+        self._photo_size = None  # 重新啟動時需重新設定標籤圖像
+        try:
+            self._frame_queue.get_nowait()  # 丟棄未轉換的畫面
+        except queue.Empty:
+            pass
+        self._ready_frame = None
+        self._shown_frame = None
+        if self._key_restore_job is not None:
+            self.root.after_cancel(self._key_restore_job)
+            self._key_restore_job = None
         self.key_display.config(text="－")
         
         logger.info("系統已停止")
@@ -288,35 +377,66 @@ class PoseDetectionGUI:
         self.audio_manager.set_volume(volume)
     
     def on_window_resize(self, event):
-        """視窗大小變化事件處理（即時響應版本）"""
-        # 只處理主視窗的變化事件，忽略子組件的變化
-        if event.widget == self.root:
-            # 立即重置緩存尺寸，強制重新計算影像尺寸
-            self.cached_widget_size = (640, 480)  # 重置為預設值，觸發重新計算
-            self.size_update_counter = 0  # 重置計數器，立即更新
-            
-            # 立即觸發一次GUI更新，不等待下一個循環
-            if self.is_running and self.current_frame is not None:
-                self.root.after_idle(self.update_gui)
-            
-            logger.debug(f"視窗大小已變化為 {event.width}x{event.height}，將立即重新調整影像尺寸")
+        """視窗大小變化事件處理（事件驅動版本）"""
+        # 根視窗的綁定也會收到子組件的事件，只處理主視窗與視頻標籤本身的變化
+        # （視頻標籤會因grid權重隨視窗調整而改變大小）
+        if event.widget is self.root or event.widget is self.video_label:
+            # 拖動視窗時事件連續觸發，延遲50ms只在最後讀取一次尺寸
+            if self._size_refresh_job is not None:
+                self.root.after_cancel(self._size_refresh_job)
+            self._size_refresh_job = self.root.after(50, self._refresh_cached_size)
+    
+    def _refresh_cached_size(self):
+        """讀取視頻標籤目前尺寸並更新緩存，尺寸改變時以新尺寸重新轉換目前畫面"""
+        self._size_refresh_job = None
+        try:
+            widget_width = self.video_label.winfo_width()
+            widget_height = self.video_label.winfo_height()
+        except Exception as e:
+            logger.debug("獲取視窗尺寸時發生錯誤: %s", e)
+            return
+        
+        # 降低最小尺寸要求，讓小視窗也能正常顯示；尺寸未變時不需重新轉換
+        if widget_width <= 50 or widget_height <= 50 or \
+                (widget_width, widget_height) == self.cached_widget_size:
+            return
+        
+        self.cached_widget_size = (widget_width, widget_height)
+        logger.debug("視窗尺寸已更新為: %dx%d", widget_width, widget_height)
+        
+        if self.is_running and self.current_frame is not None:
+            self._offer_frame(self.current_frame)
     
     def detection_worker(self):
         """優化的檢測工作線程 - 專注於幀處理"""
         frame_count = 0
         
+        # 優化：控制檢測幀率為20FPS，大幅減少CPU使用率
+        # （以截止時間計算休眠，扣除處理幀所花的時間，避免實際週期被拉長）
+        period = 0.05
+        
+        # 迴圈中每幀使用的方法先綁定為區域變數，省去重複的屬性查找
+        read_frame = self.camera_manager.read_frame
+        process_frame = self.pose_detector.process_frame
+        offer_frame = self._offer_frame
+        perf_counter = time.perf_counter
+        sleep = time.sleep
+        
+        next_tick = perf_counter() + period
+        
         while self.is_running:
             try:
                 # 讀取幀
-                frame = self.camera_manager.read_frame()
+                frame = read_frame()
                 if frame is None:
                     continue
                 
                 frame_count += 1
                 
                 # 處理幀（優化：減少不必要的處理）
-                processed_frame, results = self.pose_detector.process_frame(frame)
+                processed_frame, results = process_frame(frame)
                 self.current_frame = processed_frame
+                offer_frame(processed_frame)
                 
                 # 檢查校準狀態和語音提示（優化：避免重複播放）
                 calibration_status = results['calibration_status']
@@ -324,7 +444,7 @@ class PoseDetectionGUI:
                 if isinstance(calibration_status, dict):
                     # 新的校準結果格式，包含語音提示
                     voice_prompt = calibration_status.get('voice_prompt')
-                    if voice_prompt and self.voice_enabled.get():
+                    if voice_prompt and self._flag_cache['voice']:
                         # PoseDetector已經處理了冷卻邏輯，直接播放
                         self.audio_manager.speak(voice_prompt)
                     
@@ -333,7 +453,7 @@ class PoseDetectionGUI:
                         pass
                 else:
                     # 向後兼容：處理舊的布爾格式
-                    if calibration_status and not self.pose_detector.is_calibrated and self.voice_enabled.get():
+                    if calibration_status and not self.pose_detector.is_calibrated and self._flag_cache['voice']:
                         self.audio_manager.speak(Messages.CALIBRATION_SUCCESS)
                 
                 # 處理觸發的動作
@@ -345,54 +465,100 @@ class PoseDetectionGUI:
                 # 更新系統監控 - 直接在檢測線程中計算FPS
                 system_monitor.update_fps()
                 
-                # 優化：控制檢測幀率為20FPS，大幅減少CPU使用率
-                time.sleep(0.05)
+                sleep_for = next_tick - perf_counter()
+                if sleep_for > 0:
+                    sleep(sleep_for)
+                elif sleep_for < -period:
+                    # 落後超過一個週期時重新同步，不連續補跑積欠的幀
+                    logger.debug("檢測處理落後 %.0fms，重新同步", -sleep_for * 1000)
+                    next_tick = perf_counter()
+                next_tick += period
                 
             except Exception as e:
                 logger.error(f"檢測線程錯誤: {e}")
     
+    def _offer_frame(self, frame: np.ndarray):
+        """將畫面交給轉換線程，佇列中尚未轉換的舊幀直接丟棄"""
+        try:
+            self._frame_queue.get_nowait()
+        except queue.Empty:
+            pass
+        try:
+            self._frame_queue.put_nowait(frame)
+        except queue.Full:
+            pass
+    
+    def convert_worker(self):
+        """影像轉換線程 - 縮放與色彩轉換不佔用Tk主線程"""
+        while self.is_running:
+            try:
+                frame = self._frame_queue.get(timeout=0.1)
+            except queue.Empty:
+                continue
+            
+            try:
+                self.convert_frame(frame)
+            except Exception as e:
+                logger.error(f"影像轉換線程錯誤: {e}")
+    
     def handle_action_triggered(self, action: str):
         """處理觸發的動作"""
         # 檢查動作是否啟用
-        if not self.action_enabled[action].get():
+        if not self._flag_cache.get(action):
             return
         
         # 獲取對應按鍵
-        key = Messages.get_action_key(action)
+        key, success_message = self._action_targets[action]
         
         # 模擬按鍵
         if keyboard_sim.press_key(key):
-            self.last_action = Messages.get_success_message(action)
+            self.last_action = success_message
             self.last_key = key
+            self._key_events.put(key)
             
             # 播放成功語音
-            if self.voice_enabled.get():
+            if self._flag_cache['voice']:
                 self.audio_manager.play_action_success(action)
             
             logger.info(f"動作觸發: {action} → {key}")
     
     def gui_update_worker(self):
-        """優化的GUI更新工作線程 - 使用after方法確保線程安全"""
-        def schedule_update():
-            if self.is_running:
-                try:
-                    if self.current_frame is not None:
-                        self.update_gui()
-                except Exception as e:
-                    logger.error(f"GUI更新錯誤: {e}")
-                finally:
-                    # 調度下一次更新 - 16ms為60FPS，提供最流暢的縮放響應
-                    self.root.after(16, schedule_update)
-        
-        # 啟動GUI更新循環
-        self.root.after(50, schedule_update)  # 略微延遲開始以確保系統初始化完成
+        """優化的GUI更新 - 使用after方法確保線程安全，畫面與狀態文字分別以不同頻率更新"""
+        # 略微延遲開始以確保系統初始化完成
+        self.root.after(50, self._video_tick)
+        self.root.after(50, self._status_tick)
+    
+    def _video_tick(self):
+        """畫面更新循環 - 16ms為60FPS，提供最流暢的縮放響應"""
+        if not self.is_running:
+            return
+        try:
+            if self.current_frame is not None:
+                self.update_video_display()
+        except Exception as e:
+            logger.error(f"GUI更新錯誤: {e}")
+        finally:
+            self.root.after(16, self._video_tick)
+    
+    def _status_tick(self):
+        """狀態文字更新循環 - FPS、運行時間等每250ms更新即可"""
+        if not self.is_running:
+            return
+        try:
+            self.update_status_display()
+            # 按鍵顯示只在檢測線程送出新按鍵時才更新，不隨畫面循環檢查
+            if not self._key_events.empty():
+                self.update_key_display()
+        except Exception as e:
+            logger.error(f"GUI更新錯誤: {e}")
+        finally:
+            self.root.after(250, self._status_tick)
     
     def update_gui(self):
         """更新GUI顯示"""
         try:
             # 更新視頻顯示
-            if self.current_frame is not None:
-                self.update_video_display(self.current_frame)
+            self.update_video_display()
             
             # 更新狀態信息
             self.update_status_display()
@@ -403,66 +569,113 @@ class PoseDetectionGUI:
         except Exception as e:
             logger.error(f"更新GUI時發生錯誤: {e}")
     
-    def update_video_display(self, frame: np.ndarray):
-        """更新視頻顯示（超快響應版本）"""
+    def update_video_display(self):
+        """在Tk主線程中顯示轉換線程備妥的最新畫面（超快響應版本）"""
         try:
-            # 極速優化：每幀都檢查視窗尺寸變化以實現即時響應
-            self.size_update_counter += 1
-            should_update_size = True  # 每幀都檢查以實現最快響應
-            
-            if should_update_size:
-                try:
-                    widget_width = self.video_label.winfo_width()
-                    widget_height = self.video_label.winfo_height()
-                    
-                    # 降低最小尺寸要求，讓小視窗也能正常顯示
-                    if widget_width > 50 and widget_height > 50:
-                        # 檢查尺寸是否真的改變了，避免不必要的更新
-                        if (widget_width, widget_height) != self.cached_widget_size:
-                            self.cached_widget_size = (widget_width, widget_height)
-                            logger.debug(f"視窗尺寸已更新為: {widget_width}x{widget_height}")
-                except Exception as e:
-                    logger.debug(f"獲取視窗尺寸時發生錯誤: {e}")
-            
-            widget_width, widget_height = self.cached_widget_size
-            
-            # 獲取原始圖像尺寸
-            frame_height, frame_width = frame.shape[:2]
-            
-            # 計算縮放比例，保持寬高比（移除最大縮放限制以允許放大）
-            scale_w = widget_width / frame_width
-            scale_h = widget_height / frame_height
-            scale = min(scale_w, scale_h)  # 移除1.0的限制，允許放大顯示
-            
-            # 計算新的尺寸（確保最小為32x32，最適合小視窗顯示）
-            new_width = max(int(frame_width * scale), 32)
-            new_height = max(int(frame_height * scale), 32)
-            
-            # 確保尺寸不會超過視窗大小
-            new_width = min(new_width, widget_width)
-            new_height = min(new_height, widget_height)
-            
-            # 調整圖像大小（使用平衡的插值方法）
-            resized_frame = cv2.resize(frame, (new_width, new_height), interpolation=cv2.INTER_LINEAR)
-            
-            # 轉換為PIL圖像
-            rgb_frame = cv2.cvtColor(resized_frame, cv2.COLOR_BGR2RGB)
-            pil_image = Image.fromarray(rgb_frame)
-            photo = ImageTk.PhotoImage(pil_image)
-            
-            # 更新標籤（使用after方法確保線程安全）
-            def update_label():
-                try:
-                    self.video_label.config(image=photo, text="")
-                    self.current_photo = photo  # 保持引用
-                except:
-                    pass
+            ready = self._ready_frame
+            if ready is None or ready is self._shown_frame:
+                return
+            size, ppm_data = ready
             
-            self.root.after_idle(update_label)
+            # 重用PhotoImage並直接以PPM資料更新像素，只在顯示尺寸改變時重新建立
+            if self._photo_size != size:
+                self.current_photo = tk.PhotoImage(width=size[0], height=size[1],
+                                                   data=ppm_data, format='PPM')
+                self._photo_size = size
+                self.video_label.config(image=self.current_photo, text="")
+                if logger.isEnabledFor(logging.DEBUG):
+                    # 舊PhotoImage釋放後Tk圖像數量應維持不變，持續增加代表有圖像未被刪除
+                    logger.debug("Tk圖像數量: %d", len(self.root.tk.call('image', 'names')))
+            else:
+                self.current_photo.configure(data=ppm_data, format='PPM')
+            self._shown_frame = ready
             
         except Exception as e:
             logger.error(f"更新視頻顯示時發生錯誤: {e}")
     
+    def convert_frame(self, frame: np.ndarray):
+        """
+        將畫面縮放並轉換為PPM資料，作為下一個待顯示畫面（於轉換線程中執行）
+        
+        Args:
+            frame: BGR格式的處理後畫面
+        """
+        # 緩衝區與PPM資料皆以uint8為前提，其他型別的畫面先截斷轉換
+        if frame.dtype != np.uint8:
+            frame = np.clip(frame, 0, 255).astype(np.uint8)
+        
+        # 攝影機解析度在運行期間固定，縮放尺寸只在視窗尺寸改變時重新計算
+        target_key = (self.cached_widget_size, frame.shape[:2])
+        if target_key != self._target_key:
+            self._target_size = self.compute_display_size(*target_key)
+            self._target_interp = self.choose_interpolation(self._target_size, target_key[1])
+            self._target_key = target_key
+        size = self._target_size
+        
+        # 尺寸改變時才重新配置緩衝區，其餘幀直接寫入既有記憶體
+        if self._buf_size != size:
+            self._resize_buf = np.empty((size[1], size[0], 3), dtype=np.uint8)
+            self._rgb_buf = np.empty_like(self._resize_buf)
+            self._ppm_header = b'P6\n%d %d\n255\n' % size
+            self._buf_size = size
+        
+        # 調整圖像大小；尺寸與原始畫面相同時略過縮放，直接轉換色彩
+        if self._target_interp is None:
+            display_frame = frame
+        else:
+            cv2.resize(frame, size, dst=self._resize_buf, interpolation=self._target_interp)
+            display_frame = self._resize_buf
+        
+        # 轉換色彩後加上PPM檔頭，Tk可直接讀取而不經PIL轉換
+        # （資料為獨立的bytes，之後重用緩衝區不影響尚未顯示的畫面）
+        cv2.cvtColor(display_frame, cv2.COLOR_BGR2RGB, dst=self._rgb_buf)
+        self._ready_frame = (size, self._ppm_header + self._rgb_buf.tobytes())
+    
+    @staticmethod
+    def compute_display_size(widget_size, frame_hw):
+        """
+        計算保持寬高比的顯示尺寸
+        
+        Args:
+            widget_size: 視頻標籤尺寸 (寬, 高)
+            frame_hw: 原始畫面尺寸 (高, 寬)
+            
+        Returns:
+            Tuple[int, int]: 顯示尺寸 (寬, 高)
+        """
+        widget_width, widget_height = widget_size
+        frame_height, frame_width = frame_hw
+        
+        # 計算縮放比例，保持寬高比（移除最大縮放限制以允許放大）
+        scale_w = widget_width / frame_width
+        scale_h = widget_height / frame_height
+        scale = min(scale_w, scale_h)  # 移除1.0的限制，允許放大顯示
+        
+        # 計算新的尺寸（確保最小為32x32，最適合小視窗顯示）
+        new_width = max(int(frame_width * scale), 32)
+        new_height = max(int(frame_height * scale), 32)
+        
+        # 確保尺寸不會超過視窗大小
+        return min(new_width, widget_width), min(new_height, widget_height)
+    
+    @staticmethod
+    def choose_interpolation(size, frame_hw) -> Optional[int]:
+        """
+        依縮放方向選擇插值方法
+        
+        Args:
+            size: 顯示尺寸 (寬, 高)
+            frame_hw: 原始畫面尺寸 (高, 寬)
+            
+        Returns:
+            Optional[int]: OpenCV插值旗標，尺寸相同不需縮放時為None
+        """
+        frame_height, frame_width = frame_hw
+        if size == (frame_width, frame_height):
+            return None
+        # 縮小時INTER_AREA畫質較佳，放大時使用平衡的INTER_LINEAR
+        return cv2.INTER_AREA if size[0] < frame_width else cv2.INTER_LINEAR
+    
     def update_status_display(self):
         """更新狀態顯示（優化版本）"""
         try:
@@ -474,42 +687,60 @@ class PoseDetectionGUI:
             else:
                 status = "系統待機中"
             
-            # 使用after_idle確保線程安全
-            def update_labels():
-                try:
-                    self.status_label.config(text=status)
-                    
-                    # FPS
-                    fps = system_monitor.get_fps()
-                    self.fps_label.config(text=f"FPS: {fps:.1f}")
-                    
-                    # 運行時間
-                    runtime = system_monitor.get_runtime()
-                    self.runtime_label.config(text=f"運行時間: {runtime}")
-                    
-                    # 最後動作
-                    if self.last_action:
-                        self.last_action_label.config(text=f"最後動作: {self.last_action}")
-                except:
-                    pass
+            # 由after循環呼叫，已在Tk主線程中執行，直接更新標籤
+            self._set_label_text(self.status_label, 'status', status)
             
-            self.root.after_idle(update_labels)
+            # FPS
+            fps = system_monitor.get_fps()
+            self._set_label_text(self.fps_label, 'fps', f"FPS: {fps:.1f}")
+            
+            # 運行時間
+            runtime = system_monitor.get_runtime()
+            self._set_label_text(self.runtime_label, 'runtime', f"運行時間: {runtime}")
+            
+            # 最後動作
+            if self.last_action:
+                self._set_label_text(self.last_action_label, 'last_action',
+                                     f"最後動作: {self.last_action}")
             
         except Exception as e:
             logger.error(f"更新狀態顯示時發生錯誤: {e}")
     
+    def _set_label_text(self, label: ttk.Label, key: str, text: str):
+        """
+        設定標籤文字，與目前顯示的內容相同時略過Tk呼叫
+        
+        Args:
+            label: 目標標籤
+            key: 標籤在文字緩存中的鍵
+            text: 新文字
+        """
+        if self._label_texts.get(key) != text:
+            label.config(text=text)
+            self._label_texts[key] = text
+    
     def update_key_display(self):
-        """更新按鍵顯示"""
+        """以檢測線程送出的最新按鍵更新按鍵顯示，沒有新按鍵時不呼叫Tk"""
         try:
-            if self.last_key:
-                self.key_display.config(text=self.last_key, foreground="green")
-                # 1秒後恢復
-                self.root.after(1000, lambda: self.key_display.config(text="－", foreground="red"))
-                self.last_key = ""  # 清除以避免重複顯示
+            key = None
+            while not self._key_events.empty():
+                key = self._key_events.get_nowait()
+            
+            if key:
+                self.key_display.config(text=key, foreground="green")
+                # 1秒後恢復（取消前一次尚未執行的恢復，避免排程堆積）
+                if self._key_restore_job is not None:
+                    self.root.after_cancel(self._key_restore_job)
+                self._key_restore_job = self.root.after(1000, self._restore_key_display)
                 
         except Exception as e:
             logger.error(f"更新按鍵顯示時發生錯誤: {e}")
     
+    def _restore_key_display(self):
+        """恢復按鍵顯示為待機狀態"""
+        self._key_restore_job = None
+        self.key_display.config(text="－", foreground="red")
+    
     def on_closing(self):
         """窗口關閉事件"""
         try:
@@ -7,25 +7,41 @@ import sys
 import os
 import time
 import argparse
+import importlib.metadata
+import importlib.util
+import queue
 import signal
-from typing import Optional
+import threading
+from typing import Optional, TYPE_CHECKING
 
 # 添加當前目錄到路徑
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 from messages import Messages, SystemConfig
 from utils import logger, LoggerSetup
-from gui_app import PoseDetectionGUI
 from audio_manager_cantonese_fixed import CantoneseAudioManagerFixed
-from audio_manager import AudioTester
-from pose_detector import PoseDetector, CameraManager
+
+# GUI與姿勢檢測模組會載入MediaPipe等大型套件，延後到實際使用的模式中才導入，
+# 讓 --check 與測試模式不必付出載入成本
+if TYPE_CHECKING:
+    from gui_app import PoseDetectionGUI
+    from pose_detector import PoseDetector, CameraManager
 
 
 class PoseDetectionSystem:
     """姿勢檢測系統主類"""
     
-    def __init__(self):
-        """初始化系統"""
+    def __init__(self, use_gpu: bool = False, low_res: bool = False):
+        """
+        初始化系統
+        
+        Args:
+            use_gpu: 姿勢模型是否使用GPU委派
+            low_res: 控制台模式是否以低解析度擷取攝影機畫面
+        """
+        self.use_gpu = use_gpu
+        self.low_res = low_res
+        
         # 設定日誌
         LoggerSetup.setup_logger()
         
@@ -33,7 +49,7 @@ class PoseDetectionSystem:
         self.audio_manager = CantoneseAudioManagerFixed()
         
         # 系統組件
-        self.gui_app: Optional[PoseDetectionGUI] = None
+        self.gui_app: Optional['PoseDetectionGUI'] = None
         self.running = False
         
         # 註冊信號處理器
@@ -63,53 +79,31 @@ class PoseDetectionSystem:
         
         missing_deps = []
         
-        # 檢查必要的庫
-        try:
-            import cv2
-            logger.info(f"OpenCV版本: {cv2.__version__}")
-        except ImportError:
-            missing_deps.append("opencv-python")
-        
-        try:
-            import mediapipe as mp
-            logger.info(f"MediaPipe版本: {mp.__version__}")
-        except ImportError:
-            missing_deps.append("mediapipe")
-        
-        try:
-            import numpy as np
-            logger.info(f"NumPy版本: {np.__version__}")
-        except ImportError:
-            missing_deps.append("numpy")
-        
-        try:
-            import pygame
-            logger.info(f"Pygame版本: {pygame.version.ver}")
-        except ImportError:
-            missing_deps.append("pygame")
-        
-        try:
-            from gtts import gTTS
-            logger.info("gTTS庫可用")
-        except ImportError:
-            missing_deps.append("gTTS")
-        
-        try:
-            from PIL import Image
-            logger.info(f"Pillow版本: {Image.__version__}")
-        except ImportError:
-            missing_deps.append("Pillow")
+        # 檢查必要的庫（只查找模組與讀取套件版本，不實際導入）
+        required_deps = [
+            ('cv2', 'opencv-python', 'OpenCV'),
+            ('mediapipe', 'mediapipe', 'MediaPipe'),
+            ('numpy', 'numpy', 'NumPy'),
+            ('pygame', 'pygame', 'Pygame'),
+            ('gtts', 'gTTS', 'gTTS'),
+            ('PIL', 'Pillow', 'Pillow')
+        ]
+        for module_name, package_name, display_name in required_deps:
+            if importlib.util.find_spec(module_name) is None:
+                missing_deps.append(package_name)
+                continue
+            try:
+                logger.info(f"{display_name}版本: {importlib.metadata.version(package_name)}")
+            except importlib.metadata.PackageNotFoundError:
+                logger.info(f"{display_name}庫可用")
         
         # 檢查可選的庫
-        try:
-            import keyboard
+        if importlib.util.find_spec('keyboard') is not None:
             logger.info("keyboard庫可用")
-        except ImportError:
-            try:
-                import pynput
-                logger.info("pynput庫可用")
-            except ImportError:
-                logger.warning("鍵盤模擬庫不可用，將使用基本模擬")
+        elif importlib.util.find_spec('pynput') is not None:
+            logger.info("pynput庫可用")
+        else:
+            logger.warning("鍵盤模擬庫不可用，將使用基本模擬")
         
         if missing_deps:
             logger.error(f"缺少必要依賴: {', '.join(missing_deps)}")
@@ -124,6 +118,7 @@ class PoseDetectionSystem:
         logger.info("檢查硬體設備...")
         
         # 檢查攝影機
+        from pose_detector import CameraManager
         camera_manager = CameraManager()
         if not camera_manager.open_camera():
             logger.error("無法訪問攝影機設備")
@@ -147,8 +142,10 @@ class PoseDetectionSystem:
         logger.info("啟動GUI模式...")
         
         try:
+            from gui_app import PoseDetectionGUI
+            
             # 將音訊管理器傳遞給GUI，避免創建多個實例
-            self.gui_app = PoseDetectionGUI(audio_manager=self.audio_manager)
+            self.gui_app = PoseDetectionGUI(audio_manager=self.audio_manager, use_gpu=self.use_gpu)
             self.running = True
             
             logger.info("GUI應用已啟動")
@@ -164,10 +161,22 @@ class PoseDetectionSystem:
         """運行控制台模式（無GUI）"""
         logger.info("啟動控制台模式...")
         
+        threads = []
+        cv2_module = None
+        
         try:
             # 初始化組件
-            pose_detector = PoseDetector()
-            camera_manager = CameraManager()
+            from pose_detector import PoseDetector, CameraManager
+            pose_detector = PoseDetector(use_gpu=self.use_gpu)
+            if self.low_res:
+                # 姿勢模型內部會縮放至固定輸入尺寸，直接以低解析度擷取可減少每幀的轉換與複製量，
+                # 顯示亦直接使用同一幀，不再放大
+                camera_manager = CameraManager(
+                    width=SystemConfig.INFERENCE_WIDTH,
+                    height=SystemConfig.INFERENCE_HEIGHT
+                )
+            else:
+                camera_manager = CameraManager()
             
             if not camera_manager.open_camera():
                 logger.error("無法開啟攝影機")
@@ -179,47 +188,45 @@ class PoseDetectionSystem:
             # 播放啟動語音
             self.audio_manager.play_system_start()
             
-            # 嘗試導入cv2用於顯示
-            cv2_available = False
+            # 嘗試導入cv2用於顯示（只導入一次，迴圈中直接使用）
             try:
-                import cv2
-                cv2_available = True
+                import cv2 as cv2_module
             except ImportError:
                 logger.warning("OpenCV不可用，無法顯示圖像")
             
+            # 擷取、推論、顯示分屬不同線程，以單格佇列交接並只保留最新的幀，
+            # 整體週期取決於最慢的一段而非三者相加
+            frame_slot = queue.Queue(maxsize=1)
+            display_slot = queue.Queue(maxsize=1)
+            threads = [
+                threading.Thread(target=self._console_capture_worker,
+                                 args=(camera_manager, frame_slot), daemon=True),
+                threading.Thread(target=self._console_inference_worker,
+                                 args=(pose_detector, frame_slot, display_slot), daemon=True)
+            ]
+            for thread in threads:
+                thread.start()
+            
+            # 主線程只負責顯示處理後的幀（如果有GUI環境）
+            if cv2_module is not None:
+                imshow, wait_key = cv2_module.imshow, cv2_module.waitKey
+            
             while self.running:
                 try:
-                    # 讀取幀
-                    frame = camera_manager.read_frame()
-                    if frame is None:
+                    try:
+                        processed_frame = display_slot.get(timeout=0.1)
+                    except queue.Empty:
                         continue
                     
-                    # 處理幀
-                    processed_frame, results = pose_detector.process_frame(frame)
-                    
-                    # 顯示處理後的幀（如果有GUI環境）
-                    if cv2_available:
-                        import cv2 as cv2_module
-                        cv2_module.imshow('Pose Detection', processed_frame)
-                        if cv2_module.waitKey(1) & 0xFF == ord('q'):
+                    if cv2_module is not None:
+                        imshow('Pose Detection', processed_frame)
+                        if wait_key(1) & 0xFF == ord('q'):
                             break
-                    
-                    # 處理檢測結果
-                    if results['calibration_status'] and not pose_detector.is_calibrated:
-                        self.audio_manager.play_calibration_success()
-                    
-                    # 處理觸發的動作
-                    if pose_detector.is_calibrated:
-                        triggered_actions = pose_detector.get_triggered_actions()
-                        for action in triggered_actions:
-                            key = Messages.get_action_key(action)
-                            logger.info(f"動作觸發: {action} → {key}")
-                            self.audio_manager.play_action_success(action)
                 
                 except KeyboardInterrupt:
                     break
                 except Exception as e:
-                    logger.error(f"處理幀時發生錯誤: {e}")
+                    logger.error(f"顯示幀時發生錯誤: {e}")
             
         except Exception as e:
             logger.error(f"控制台模式運行失敗: {e}")
@@ -227,16 +234,99 @@ class PoseDetectionSystem:
         finally:
             self.running = False
             try:
+                # 等待工作線程結束後才關閉攝影機與檢測器
+                for thread in threads:
+                    thread.join(timeout=2.0)
                 if 'camera_manager' in locals() and camera_manager:
                     camera_manager.close_camera()
                 if 'pose_detector' in locals() and pose_detector:
                     pose_detector.cleanup()
-                if cv2_available:
-                    import cv2 as cv2_module
+                if cv2_module is not None:
                     cv2_module.destroyAllWindows()
             except Exception as e:
                 logger.error(f"清理資源時發生錯誤: {e}")
     
+    def _console_capture_worker(self, camera_manager: 'CameraManager', frame_slot: queue.Queue):
+        """
+        控制台模式的擷取線程
+        
+        每幀都grab以推進攝影機串流，只在到達推論時間且推論線程已取走上一幀時才解碼，
+        確保交給推論的是最新的畫面
+        
+        Args:
+            camera_manager: 攝影機管理器
+            frame_slot: 交給推論線程的單格佇列
+        """
+        infer_interval = 1.0 / SystemConfig.DETECTION_FPS
+        next_infer = 0.0
+        
+        while self.running:
+            try:
+                if not camera_manager.grab():
+                    time.sleep(0.01)
+                    continue
+                
+                now = time.perf_counter()
+                if now < next_infer or frame_slot.full():
+                    continue
+                
+                # 解碼幀
+                frame = camera_manager.retrieve()
+                if frame is None:
+                    continue
+                
+                frame_slot.put_nowait(frame)
+                next_infer = now + infer_interval
+            
+            except queue.Full:
+                pass
+            except Exception as e:
+                logger.error(f"擷取幀時發生錯誤: {e}")
+    
+    def _console_inference_worker(self, pose_detector: 'PoseDetector',
+                                  frame_slot: queue.Queue, display_slot: queue.Queue):
+        """
+        控制台模式的推論線程
+        
+        Args:
+            pose_detector: 姿勢檢測器
+            frame_slot: 擷取線程交來的單格佇列
+            display_slot: 交給主線程顯示的單格佇列
+        """
+        get_action_info = Messages.get_action_info
+        
+        while self.running:
+            try:
+                try:
+                    frame = frame_slot.get(timeout=0.1)
+                except queue.Empty:
+                    continue
+                
+                # 處理幀
+                processed_frame, results = pose_detector.process_frame(frame)
+                
+                # 交給主線程顯示，尚未顯示的舊幀直接丟棄
+                try:
+                    display_slot.get_nowait()
+                except queue.Empty:
+                    pass
+                display_slot.put_nowait(processed_frame)
+                
+                # 處理檢測結果
+                if results['calibration_status'] and not pose_detector.is_calibrated:
+                    self.audio_manager.play_calibration_success()
+                
+                # 處理觸發的動作
+                if pose_detector.is_calibrated:
+                    triggered_actions = pose_detector.get_triggered_actions()
+                    for action in triggered_actions:
+                        key, _ = get_action_info(action)
+                        logger.info(f"動作觸發: {action} → {key}")
+                        self.audio_manager.play_action_success(action)
+            
+            except Exception as e:
+                logger.error(f"處理幀時發生錯誤: {e}")
+    
     def run_test_mode(self):
         """運行測試模式"""
         logger.info("啟動測試模式...")
@@ -254,19 +344,23 @@ class PoseDetectionSystem:
                 Messages.get_success_message('right_hand')
             ]
             
+            # 先並行生成所有測試語音，播放時不必逐句等待網路請求
+            self.audio_manager.prefetch(test_messages)
+            
             for i, message in enumerate(test_messages, 1):
                 logger.info(f"測試 {i}: {message}")
-                success = self.audio_manager.speak(message)
+                # 阻塞至實際播放完成，取代固定等待
+                success = self.audio_manager.speak_blocking(message)
                 if success:
                     logger.info("✅ 語音播放成功")
                 else:
                     logger.error("❌ 語音播放失敗")
-                time.sleep(2)  # 等待播放完成
             
             logger.info("粵語音訊測試完成")
             
             # 測試姿勢檢測
-            pose_detector = PoseDetector()
+            from pose_detector import PoseDetector, CameraManager
+            pose_detector = PoseDetector(use_gpu=self.use_gpu)
             logger.info("姿勢檢測器創建成功")
             pose_detector.cleanup()
             
@@ -317,6 +411,8 @@ def create_argument_parser() -> argparse.ArgumentParser:
   python main.py --mode console     # 啟動控制台模式
   python main.py --mode test        # 運行測試模式
   python main.py --check           # 檢查系統依賴和硬體
+  python main.py --gpu             # 姿勢模型使用GPU委派
+  python main.py -m console --low-res  # 控制台模式低解析度擷取
         """
     )
     
@@ -346,6 +442,18 @@ def create_argument_parser() -> argparse.ArgumentParser:
         help='攝影機索引（預設: 0）'
     )
     
+    parser.add_argument(
+        '--gpu',
+        action='store_true',
+        help=f'姿勢模型使用GPU委派（需要模型檔案 {SystemConfig.POSE_MODEL_PATH}，失敗時改用CPU）'
+    )
+    
+    parser.add_argument(
+        '--low-res',
+        action='store_true',
+        help=f'控制台模式以 {SystemConfig.INFERENCE_WIDTH}x{SystemConfig.INFERENCE_HEIGHT} 擷取攝影機畫面'
+    )
+    
     parser.add_argument(
         '--version', '-v',
         action='version',
@@ -363,7 +471,7 @@ def main():
     
     try:
         # 創建系統實例
-        system = PoseDetectionSystem()
+        system = PoseDetectionSystem(use_gpu=args.gpu, low_res=args.low_res)
         
         # 設定攝影機索引
         SystemConfig.CAMERA_INDEX = args.camera
@@ -3,6 +3,9 @@
 統一管理所有語音提示的文字內容，支援多語言
 """
 
+from functools import lru_cache
+
+
 class Messages:
     """語音訊息類別，集中管理所有語音提示"""
     
@@ -45,6 +48,17 @@ class Messages:
         'turn_right_head': '檢測到向右擰頭'
     }
     
+    # 語音提示之後可能接著播放的提示（用於在播放時背景預先生成下一句）
+    NEXT_HINT = {
+        SYSTEM_START: [CALIBRATION_START, CALIBRATION_INSTRUCTION],
+        CALIBRATION_START: [CALIBRATION_INSTRUCTION, CALIBRATION_SUCCESS, CALIBRATION_FAILED],
+        CALIBRATION_INSTRUCTION: [CALIBRATION_SUCCESS, CALIBRATION_FAILED],
+        CALIBRATION_FAILED: [CALIBRATION_START, CALIBRATION_INSTRUCTION],
+        DISTANCE_TOO_CLOSE: [CALIBRATION_SUCCESS],
+        DISTANCE_TOO_FAR: [CALIBRATION_SUCCESS],
+        BODY_NOT_COMPLETE: [CALIBRATION_SUCCESS],
+    }
+    
     # 鍵盤對應
     ACTION_KEYS = {
         'left_hand': 'A',
@@ -92,13 +106,21 @@ class Messages:
     }
     
     @classmethod
+    @lru_cache(maxsize=1)
     def get_all_instructions(cls):
-        """獲取所有動作說明的完整文字"""
+        """獲取所有動作說明的完整文字（結果只計算一次，確保語音快取鍵穩定）"""
         instructions = []
         for action, instruction in cls.ACTION_INSTRUCTIONS.items():
             instructions.append(instruction)
         return "。".join(instructions)
     
+    @classmethod
+    def get_next_hints(cls, text):
+        """獲取某句語音之後可能接著播放的語音"""
+        if text == cls.CALIBRATION_SUCCESS:
+            return [cls.get_all_instructions()]
+        return cls.NEXT_HINT.get(text, [])
+    
     @classmethod
     def get_action_key(cls, action):
         """根據動作名稱獲取對應按鍵"""
@@ -108,6 +130,22 @@ class Messages:
     def get_success_message(cls, action):
         """根據動作名稱獲取成功檢測訊息"""
         return cls.ACTION_SUCCESS.get(action, f"檢測到{action}")
+    
+    @classmethod
+    def get_action_info(cls, action):
+        """根據動作名稱一次獲取 (按鍵, 成功檢測訊息)"""
+        info = cls.ACTION_LOOKUP.get(action)
+        if info is None:
+            info = (cls.get_action_key(action), cls.get_success_message(action))
+        return info
+
+
+# 動作 -> (按鍵, 成功訊息) 合併查表，觸發動作時只需一次字典查找
+# （類別主體內的推導式無法存取其他類別屬性，故於類別定義後建立）
+Messages.ACTION_LOOKUP = {
+    action: (key, Messages.ACTION_SUCCESS[action])
+    for action, key in Messages.ACTION_KEYS.items()
+}
 
 
 # 動作檢測的閾值參數
@@ -143,6 +181,12 @@ class SystemConfig:
     CAMERA_WIDTH = 640           # 攝影機寬度
     CAMERA_HEIGHT = 480          # 攝影機高度
     CAMERA_FPS = 30              # 攝影機幀率
+    INFERENCE_WIDTH = 320        # --low-res 時控制台模式的擷取寬度（直接作為推論與顯示輸入）
+    INFERENCE_HEIGHT = 240       # --low-res 時控制台模式的擷取高度
+    DETECTION_FPS = 15           # 控制台模式的姿勢推論幀率（其餘幀只grab不解碼）
+    
+    # 姿勢模型設定（--gpu 時使用 MediaPipe Tasks 的 PoseLandmarker 與 GPU 委派）
+    POSE_MODEL_PATH = "models/pose_landmarker_lite.task"  # PoseLandmarker模型檔案
     
     # GUI設定
     GUI_WIDTH = 800              # GUI視窗寬度
@@ -151,6 +195,27 @@ class SystemConfig:
     # 語音設定
     TTS_LANGUAGE = 'zh-tw'       # gTTS語言設定（繁體中文/廣東話）
     TTS_SLOW = False             # TTS語速
+    TTS_BACKEND = 'gtts'         # 語音合成後端：'gtts'（網路）或 'piper'（離線）
+    PIPER_EXECUTABLE = 'piper'   # piper命令列工具
+    PIPER_MODEL = ''             # piper語音模型(.onnx)路徑，留空則不使用piper
+    PIPER_TIMEOUT = 30           # piper單句合成逾時（秒）
+    AUDIO_TRANSCODE_WAV = True   # 將gTTS的MP3轉為WAV以省去播放時的解碼（需要ffmpeg）
+    FFMPEG_EXECUTABLE = 'ffmpeg' # ffmpeg命令列工具
+    FFMPEG_TIMEOUT = 30          # 單檔轉換逾時（秒）
+    TTS_PREGENERATE_WORKERS = 8  # 預生成語音的並行線程數
+    AUDIO_FREQUENCY = 24000      # 混音器取樣率（與gTTS輸出一致，避免重新取樣）
+    AUDIO_SIZE = -16             # 取樣位元數（16位元有號）
+    AUDIO_CHANNELS = 1           # 聲道數（語音為單聲道，減少混音器的資料量）
+    AUDIO_BUFFER = 4096          # 混音緩衝區大小（約170ms，姿勢偵測佔用CPU時也不會斷音）
+    AUDIO_CACHE_MAX = 256        # 語音快取最多保留的項目數（超出時刪除最久未用的檔案）
+    AUDIO_DUPLICATE_TTL = 2.0    # 相同語音播放後在此秒數內不再重複加入佇列
+    SPEECH_QUEUE_MAX = 8         # 語音佇列上限（超出時丟棄最舊的待播語音）
+    LOCAL_TTS_PREGENERATE = True # 本地語音可用時，預先以本地引擎輸出常用提示為WAV並由pygame播放
+    LOCAL_TTS_SUBPROCESS = True  # 在獨立子程序中驅動pyttsx3（失敗時改用語音線程）
+    LOCAL_TTS_TIMEOUT = 60       # 等待語音子程序完成單一指令的上限（秒），逾時即重啟子程序
+    AUDIO_CLIP_GAP = 0.05        # 連續語音之間的間隔（秒）
+    AUDIO_PLAYBACK_TIMEOUT = 30.0  # 等待單段語音播放完成的上限（秒）
+    AUDIO_POLL_INTERVAL = 0.05   # 等待語音播放完成時檢查聲道狀態的間隔（秒）
     
     # 日誌設定
     LOG_LEVEL = "INFO"           # 日誌級別
@@ -158,4 +223,6 @@ class SystemConfig:
     
     # 音訊檔案設定
     SOUND_DIR = "sounds"         # 音訊檔案目錄
-    SOUND_FORMAT = "mp3"         # 音訊格式
\ No newline at end of file
+    SOUND_FORMAT = "mp3"         # 音訊格式
+    SOUND_CACHE_TTL = 7 * 24 * 3600      # 語音檔案未使用超過此秒數即清除
+    SOUND_CACHE_SWEEP_INTERVAL = 3600    # 語音目錄定期清理的間隔（秒）
\ No newline at end of file
@@ -17,15 +17,24 @@ from utils import logger, action_buffer, profiler
 class PoseDetector:
     """姿勢檢測器類別"""
     
-    def __init__(self):
-        """初始化姿勢檢測器"""
+    def __init__(self, use_gpu: bool = False):
+        """
+        初始化姿勢檢測器
+        
+        Args:
+            use_gpu: 是否以GPU委派執行姿勢模型（失敗時退回CPU）
+        """
         # MediaPipe初始化
         self.mp_pose = mp.solutions.pose
         self.mp_drawing = mp.solutions.drawing_utils
         self.mp_drawing_styles = mp.solutions.drawing_styles
         
+        # GPU姿勢模型（Tasks API），建立成功時取代下面的CPU模型進行推論
+        self.landmarker = self._create_gpu_landmarker() if use_gpu else None
+        self._last_timestamp_ms = 0
+        
         # 姿勢檢測模型（優化性能）
-        self.pose = self.mp_pose.Pose(
+        self.pose = None if self.landmarker else self.mp_pose.Pose(
             min_detection_confidence=0.7,  # 提高閾值減少誤檢
             min_tracking_confidence=0.5,
             model_complexity=0  # 使用最簡單模型提高FPS
@@ -63,9 +72,68 @@ class PoseDetector:
         # 緩存字體以提高性能
         self.font_cache = None
         self._initialize_font_cache()
+        self._fonts: Dict[int, Any] = {}  # 字體大小 -> 中文字體，避免每次繪製都從磁碟載入
         
         logger.info("姿勢檢測器初始化完成")
     
+    def _create_gpu_landmarker(self):
+        """
+        建立使用GPU委派的PoseLandmarker
+        
+        Returns:
+            Optional[PoseLandmarker]: 建立失敗（模型不存在或不支援GPU）時為None
+        """
+        try:
+            from mediapipe.tasks import python as mp_tasks
+            from mediapipe.tasks.python import vision
+            
+            options = vision.PoseLandmarkerOptions(
+                base_options=mp_tasks.BaseOptions(
+                    model_asset_path=SystemConfig.POSE_MODEL_PATH,
+                    delegate=mp_tasks.BaseOptions.Delegate.GPU
+                ),
+                running_mode=vision.RunningMode.VIDEO,
+                min_pose_detection_confidence=0.7,
+                min_tracking_confidence=0.5
+            )
+            landmarker = vision.PoseLandmarker.create_from_options(options)
+            logger.info("姿勢模型使用GPU委派")
+            return landmarker
+        except Exception as e:
+            logger.warning(f"無法使用GPU姿勢模型，改用CPU: {e}")
+            return None
+    
+    def _detect_landmarks(self, rgb_frame: np.ndarray):
+        """
+        偵測姿勢關鍵點
+        
+        Args:
+            rgb_frame: RGB格式的圖像幀
+            
+        Returns:
+            Optional[NormalizedLandmarkList]: 關鍵點，未偵測到時為None
+        """
+        if self.landmarker is None:
+            return self.pose.process(rgb_frame).pose_landmarks
+        
+        # VIDEO模式要求時間戳嚴格遞增
+        timestamp_ms = max(int(time.monotonic() * 1000), self._last_timestamp_ms + 1)
+        self._last_timestamp_ms = timestamp_ms
+        
+        mp_image = mp.Image(image_format=mp.ImageFormat.SRGB, data=rgb_frame)
+        result = self.landmarker.detect_for_video(mp_image, timestamp_ms)
+        if not result.pose_landmarks:
+            return None
+        
+        # 轉換為與solutions API相同的格式，供繪製與動作檢測沿用
+        from mediapipe.framework.formats import landmark_pb2
+        landmarks = landmark_pb2.NormalizedLandmarkList()
+        landmarks.landmark.extend(
+            landmark_pb2.NormalizedLandmark(x=point.x, y=point.y, z=point.z, visibility=point.visibility)
+            for point in result.pose_landmarks[0]
+        )
+        return landmarks
+    
     def _initialize_font_cache(self):
         """初始化字體緩存"""
         try:
@@ -79,6 +147,63 @@ class PoseDetector:
                 # 使用預設字體
                 self.font_cache = ImageFont.load_default()
     
+    def _get_font(self, font_size: int):
+        """
+        取得指定大小的中文字體（首次使用時載入並緩存）
+        
+        Args:
+            font_size: 字體大小
+            
+        Returns:
+            ImageFont: PIL字體
+        """
+        font = self._fonts.get(font_size)
+        if font is None:
+            try:
+                # 使用系統中文字體
+                font = ImageFont.truetype("C:/Windows/Fonts/msyh.ttc", font_size)
+            except:
+                try:
+                    font = ImageFont.truetype("C:/Windows/Fonts/simhei.ttf", font_size)
+                except:
+                    # 使用默認字體
+                    font = ImageFont.load_default()
+            self._fonts[font_size] = font
+        return font
+    
+    def _draw_pil_text(self, img, items, font):
+        """
+        以PIL繪製文字，只轉換文字所在的區域而非整幅圖像
+        
+        Args:
+            img: OpenCV圖像（原地修改）
+            items: [(位置, 文字, RGB顏色)] 依序繪製
+            font: PIL字體
+        """
+        height, width = img.shape[:2]
+        
+        # 所有文字外框的聯集（略為外擴以保留抗鋸齒邊緣），並限制在圖像範圍內
+        boxes = []
+        for (x, y), text, _ in items:
+            left, top, right, bottom = font.getbbox(text)
+            boxes.append((x + left, y + top, x + right, y + bottom))
+        x0 = max(int(min(box[0] for box in boxes)) - 2, 0)
+        y0 = max(int(min(box[1] for box in boxes)) - 2, 0)
+        x1 = min(int(max(box[2] for box in boxes)) + 2, width)
+        y1 = min(int(max(box[3] for box in boxes)) + 2, height)
+        if x0 >= x1 or y0 >= y1:
+            return
+        
+        # 轉換區域為PIL圖像並繪製
+        roi = img[y0:y1, x0:x1]
+        roi_pil = Image.fromarray(cv2.cvtColor(roi, cv2.COLOR_BGR2RGB))
+        draw = ImageDraw.Draw(roi_pil)
+        for (x, y), text, fill in items:
+            draw.text((x - x0, y - y0), text, font=font, fill=fill)
+        
+        # 轉換回OpenCV格式並寫回原圖像
+        roi[:] = cv2.cvtColor(np.asarray(roi_pil), cv2.COLOR_RGB2BGR)
+    
     def _put_chinese_text(self, img, text, position, font_size=24, color=(0, 255, 0)):
         """
         在圖像上繪製中文文字（使用PIL/Pillow實現完整中文支持）
@@ -95,36 +220,9 @@ class PoseDetector:
             has_chinese = any('\u4e00' <= char <= '\u9fff' for char in text)
             
             if has_chinese:
-                # 使用PIL繪製中文文字
-                from PIL import Image, ImageDraw, ImageFont
-                import numpy as np
-                
-                # 轉換OpenCV圖像為PIL圖像
-                img_pil = Image.fromarray(cv2.cvtColor(img, cv2.COLOR_BGR2RGB))
-                draw = ImageDraw.Draw(img_pil)
-                
-                # 設置字體
-                try:
-                    # 使用系統中文字體
-                    font = ImageFont.truetype("C:/Windows/Fonts/msyh.ttc", font_size)
-                except:
-                    try:
-                        font = ImageFont.truetype("C:/Windows/Fonts/simhei.ttf", font_size)
-                    except:
-                        # 使用默認字體
-                        font = ImageFont.load_default()
-                
-                # 轉換顏色格式 (BGR -> RGB)
+                # 使用PIL繪製中文文字（轉換顏色格式 BGR -> RGB）
                 pil_color = (color[2], color[1], color[0])
-                
-                # 繪製文字
-                draw.text(position, text, font=font, fill=pil_color)
-                
-                # 轉換回OpenCV格式
-                img_opencv = cv2.cvtColor(np.array(img_pil), cv2.COLOR_RGB2BGR)
-                
-                # 將結果複製回原圖像
-                img[:] = img_opencv
+                self._draw_pil_text(img, [(position, text, pil_color)], self._get_font(font_size))
                 
             else:
                 # 英文字符使用OpenCV直接繪製
@@ -158,44 +256,24 @@ class PoseDetector:
             font_size: 字體大小
         """
         try:
-            from PIL import Image, ImageDraw, ImageFont
-            import numpy as np
-            
             height, width = img.shape[:2]
             center_x = width // 2
             center_y = height // 2
             
-            # 轉換OpenCV圖像為PIL圖像
-            img_pil = Image.fromarray(cv2.cvtColor(img, cv2.COLOR_BGR2RGB))
-            draw = ImageDraw.Draw(img_pil)
-            
             # 設置大字體
-            try:
-                font = ImageFont.truetype("C:/Windows/Fonts/msyh.ttc", font_size)
-            except:
-                try:
-                    font = ImageFont.truetype("C:/Windows/Fonts/simhei.ttf", font_size)
-                except:
-                    font = ImageFont.load_default()
+            font = self._get_font(font_size)
             
             # 計算文字尺寸以便居中
-            bbox = draw.textbbox((0, 0), text, font=font)
+            bbox = font.getbbox(text)
             text_width = bbox[2] - bbox[0]
             text_height = bbox[3] - bbox[1]
             
             text_x = center_x - text_width // 2
             text_y = center_y - text_height // 2
             
-            # 繪製陰影（黑色）
-            draw.text((text_x + 3, text_y + 3), text, font=font, fill=(0, 0, 0))
-            # 繪製主文字（綠色）
-            draw.text((text_x, text_y), text, font=font, fill=(0, 255, 0))
-            
-            # 轉換回OpenCV格式
-            img_opencv = cv2.cvtColor(np.array(img_pil), cv2.COLOR_RGB2BGR)
-            
-            # 將結果複製回原圖像
-            img[:] = img_opencv
+            # 繪製陰影（黑色），再繪製主文字（綠色）
+            self._draw_pil_text(img, [((text_x + 3, text_y + 3), text, (0, 0, 0)),
+                                      ((text_x, text_y), text, (0, 255, 0))], font)
             
         except Exception as e:
             # 如果失敗，使用英文显示
@@ -241,31 +319,31 @@ class PoseDetector:
         rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
         
         # 姿勢檢測
-        results = self.pose.process(rgb_frame)
+        pose_landmarks = self._detect_landmarks(rgb_frame)
         
-        if results.pose_landmarks:
+        if pose_landmarks:
             detection_results['pose_detected'] = True
-            detection_results['landmarks'] = results.pose_landmarks
+            detection_results['landmarks'] = pose_landmarks
             
             # 更新當前landmarks
             self.previous_landmarks = self.current_landmarks
-            self.current_landmarks = results.pose_landmarks
+            self.current_landmarks = pose_landmarks
             
             # 繪製姿勢骨架
             self.mp_drawing.draw_landmarks(
                 frame,
-                results.pose_landmarks,
+                pose_landmarks,
                 self.mp_pose.POSE_CONNECTIONS,
                 landmark_drawing_spec=self.mp_drawing_styles.get_default_pose_landmarks_style()
             )
             
             # 校準檢查
             if not self.is_calibrated:
-                calibration_result = self._check_calibration(results.pose_landmarks)
+                calibration_result = self._check_calibration(pose_landmarks)
                 detection_results['calibration_status'] = calibration_result
             else:
                 # 動作檢測
-                detected_actions = self._detect_actions(results.pose_landmarks)
+                detected_actions = self._detect_actions(pose_landmarks)
                 detection_results['actions'] = detected_actions
         
         # 添加狀態信息到圖像
@@ -1030,23 +1108,39 @@ class PoseDetector:
         """清理資源"""
         if self.pose:
             self.pose.close()
+        if self.landmarker:
+            self.landmarker.close()
         logger.info("姿勢檢測器已清理")
 
 
 class CameraManager:
     """攝影機管理器"""
     
-    def __init__(self, camera_index: int = SystemConfig.CAMERA_INDEX):
+    # 輸出幀的環形緩衝區格數：返回的幀在之後再解碼三幀前保持不變，
+    # 足夠擷取、檢測與顯示（或影像轉換）線程之間逐格交接使用
+    FRAME_RING_SIZE = 4
+    
+    def __init__(self, camera_index: int = SystemConfig.CAMERA_INDEX,
+                 width: Optional[int] = None, height: Optional[int] = None):
         """
         初始化攝影機管理器
         
         Args:
             camera_index: 攝影機索引
+            width: 擷取寬度（預設為 SystemConfig.CAMERA_WIDTH）
+            height: 擷取高度（預設為 SystemConfig.CAMERA_HEIGHT）
         """
         self.camera_index = camera_index
+        self.width = width or SystemConfig.CAMERA_WIDTH
+        self.height = height or SystemConfig.CAMERA_HEIGHT
         self.cap = None
         self.is_opened = False
         
+        # 重用的讀取緩衝區與輸出幀環形緩衝區，避免每幀配置新陣列
+        self._raw_buf = None
+        self._frame_ring: List[np.ndarray] = []
+        self._ring_index = 0
+        
     def open_camera(self) -> bool:
         """
         開啟攝影機
@@ -1061,9 +1155,16 @@ class CameraManager:
                 logger.error(f"無法開啟攝影機 {self.camera_index}")
                 return False
             
+            # 只保留最新一幀，避免驅動程式佇列中的舊幀造成延遲
+            if not self.cap.set(cv2.CAP_PROP_BUFFERSIZE, 1):
+                logger.warning("攝影機不支援設定緩衝區大小，可能讀到延遲的畫面")
+            
+            # 優先使用MJPEG格式，降低每幀傳輸的資料量（需在設定解析度前指定）
+            self.cap.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*'MJPG'))
+            
             # 設定攝影機參數
-            self.cap.set(cv2.CAP_PROP_FRAME_WIDTH, SystemConfig.CAMERA_WIDTH)
-            self.cap.set(cv2.CAP_PROP_FRAME_HEIGHT, SystemConfig.CAMERA_HEIGHT)
+            self.cap.set(cv2.CAP_PROP_FRAME_WIDTH, self.width)
+            self.cap.set(cv2.CAP_PROP_FRAME_HEIGHT, self.height)
             self.cap.set(cv2.CAP_PROP_FPS, SystemConfig.CAMERA_FPS)
             
             self.is_opened = True
@@ -1078,20 +1179,63 @@ class CameraManager:
         """
         讀取一幀圖像
         
+        Returns:
+            Optional[np.ndarray]: 圖像幀，如果失敗則返回None
+        """
+        if not self.grab():
+            return None
+        return self.retrieve()
+    
+    def grab(self) -> bool:
+        """
+        抓取下一幀但不解碼，略過的幀只推進串流而不付出解碼成本
+        
+        Returns:
+            bool: 是否成功抓取
+        """
+        if not self.is_opened or not self.cap:
+            return False
+        return self.cap.grab()
+    
+    def retrieve(self) -> Optional[np.ndarray]:
+        """
+        解碼最近一次grab()抓取的幀
+        
         Returns:
             Optional[np.ndarray]: 圖像幀，如果失敗則返回None
         """
         if not self.is_opened or not self.cap:
             return None
         
-        ret, frame = self.cap.read()
+        ret, raw = self.cap.retrieve(self._raw_buf)
         if ret:
-            # 水平翻轉圖像（鏡像效果）
-            frame = cv2.flip(frame, 1)
+            self._raw_buf = raw
+            # 水平翻轉圖像（鏡像效果），寫入環形緩衝區的下一格
+            frame = self._next_ring_slot(raw)
+            cv2.flip(raw, 1, dst=frame)
             return frame
         
         return None
     
+    def _next_ring_slot(self, raw: np.ndarray) -> np.ndarray:
+        """
+        取得環形緩衝區的下一格，解析度改變時重新配置
+        
+        Args:
+            raw: 攝影機讀取的原始幀
+            
+        Returns:
+            np.ndarray: 可寫入的輸出幀緩衝區
+        """
+        if not self._frame_ring or self._frame_ring[0].shape != raw.shape \
+                or self._frame_ring[0].dtype != raw.dtype:
+            self._frame_ring = [np.empty_like(raw) for _ in range(self.FRAME_RING_SIZE)]
+            self._ring_index = 0
+        
+        frame = self._frame_ring[self._ring_index]
+        self._ring_index = (self._ring_index + 1) % self.FRAME_RING_SIZE
+        return frame
+    
     def close_camera(self):
         """關閉攝影機"""
         if self.cap:
@@ -0,0 +1,54 @@
+"""
+本地語音子程序
+在獨立程序的主線程中驅動 pyttsx3，避免其在多線程程式中卡死或遺失語音
+
+通訊協定：標準輸入每行一個 JSON 指令 {"kind": ..., "payload": ...}，
+每個指令處理完成後於標準輸出回覆一行 "ok" 或 "error <訊息>"；
+啟動完成時先輸出 "ready"，標準輸入關閉時結束程序
+"""
+
+import json
+import sys
+
+
+def main():
+    """語音子程序主迴圈"""
+    sys.stdin.reconfigure(encoding='utf-8')
+    sys.stdout.reconfigure(encoding='utf-8')
+
+    try:
+        import pyttsx3
+        engine = pyttsx3.init()
+    except Exception as e:
+        print(f"error {e}", flush=True)
+        return
+
+    print("ready", flush=True)
+
+    for line in sys.stdin:
+        try:
+            cmd = json.loads(line)
+            kind = cmd['kind']
+            payload = cmd.get('payload')
+
+            if kind == 'speak':
+                engine.say(payload)
+                engine.runAndWait()
+            elif kind == 'save':
+                text, filepath = payload
+                engine.save_to_file(text, filepath)
+                engine.runAndWait()
+            elif kind in ('volume', 'rate', 'voice'):
+                engine.setProperty(kind, payload)
+            elif kind == 'stop':
+                engine.stop()
+
+            reply = "ok"
+        except Exception as e:
+            reply = f"error {e}"
+
+        print(reply, flush=True)
+
+
+if __name__ == "__main__":
+    main()
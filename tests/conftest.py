@@ -0,0 +1,9 @@
+"""
+測試設定
+將專案根目錄加入模組搜尋路徑，直接執行 pytest 時亦可導入各模組
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -0,0 +1,149 @@
+"""
+AudioCache 測試
+驗證LRU淘汰、播放中檔案的延後刪除，以及磁碟檔案紀錄的一致性
+"""
+
+import os
+
+import pytest
+
+from audio_manager import AudioCache
+from messages import SystemConfig
+
+
+def _make_voice(directory, name, with_source=True):
+    """
+    建立轉換後的WAV語音檔案及其來源MP3
+    
+    Args:
+        directory: 語音目錄
+        name: 不含副檔名的檔案名稱
+        with_source: 是否同時建立來源MP3
+        
+    Returns:
+        Tuple[str, str]: (WAV路徑, 來源MP3路徑)
+    """
+    wav = directory / f"{name}.wav"
+    source = directory / f"{name}.{SystemConfig.SOUND_FORMAT}"
+    wav.write_bytes(b"wav")
+    if with_source:
+        source.write_bytes(b"mp3")
+    return str(wav), str(source)
+
+
+@pytest.fixture
+def voices(tmp_path):
+    """三組語音檔案"""
+    return [_make_voice(tmp_path, f"voice_{i}") for i in range(3)]
+
+
+def test_get_marks_entry_recently_used(voices):
+    """命中的項目成為最近使用，淘汰時保留"""
+    cache = AudioCache(max_items=2)
+    (wav_a, _), (wav_b, _), (wav_c, _) = voices
+    cache.put(('a',), wav_a)
+    cache.put(('b',), wav_b)
+    
+    assert cache.get(('a',)) == wav_a
+    cache.put(('c',), wav_c)
+    
+    assert cache.get(('a',)) == wav_a
+    assert cache.get(('b',)) is None
+    assert cache.get(('c',)) == wav_c
+
+
+def test_eviction_deletes_wav_and_source_mp3(voices):
+    """淘汰時同時刪除WAV及其來源MP3，並更新檔案紀錄"""
+    cache = AudioCache(max_items=1)
+    (wav_a, mp3_a), (wav_b, mp3_b), _ = voices
+    cache.add_file(mp3_a)
+    cache.put(('a',), wav_a)
+    cache.put_sound(wav_a, object())
+    
+    cache.put(('b',), wav_b)
+    
+    assert not os.path.exists(wav_a)
+    assert not os.path.exists(mp3_a)
+    assert not cache.has_file(wav_a)
+    assert not cache.has_file(mp3_a)
+    assert cache.get_sound(wav_a) is None
+    assert os.path.exists(wav_b) and os.path.exists(mp3_b)
+    assert cache.has_file(wav_b)
+
+
+def test_eviction_without_source_file(tmp_path):
+    """沒有來源MP3（例如piper直接輸出WAV）時照常淘汰"""
+    cache = AudioCache(max_items=1)
+    wav_a, _ = _make_voice(tmp_path, "voice_a", with_source=False)
+    wav_b, _ = _make_voice(tmp_path, "voice_b", with_source=False)
+    cache.put(('a',), wav_a)
+    cache.put(('b',), wav_b)
+    
+    assert not os.path.exists(wav_a)
+    assert os.path.exists(wav_b)
+
+
+def test_pinned_file_kept_until_unpin(voices):
+    """佇列中或播放中的檔案被淘汰時延後到最後一次釋放才刪除"""
+    cache = AudioCache(max_items=1)
+    (wav_a, mp3_a), (wav_b, _), _ = voices
+    cache.put(('a',), wav_a)
+    cache.pin(wav_a)
+    cache.pin(wav_a)
+    
+    cache.put(('b',), wav_b)
+    assert cache.get(('a',)) is None
+    assert os.path.exists(wav_a) and os.path.exists(mp3_a)
+    assert cache.has_file(wav_a)
+    
+    cache.unpin(wav_a)
+    assert os.path.exists(wav_a)
+    
+    cache.unpin(wav_a)
+    assert not os.path.exists(wav_a)
+    assert not os.path.exists(mp3_a)
+    assert not cache.has_file(wav_a)
+
+
+def test_reused_before_unpin_is_not_deleted(voices):
+    """延後刪除前再次放入快取的檔案，釋放時不刪除"""
+    cache = AudioCache(max_items=1)
+    (wav_a, mp3_a), (wav_b, _), _ = voices
+    cache.put(('a',), wav_a)
+    cache.pin(wav_a)
+    cache.put(('b',), wav_b)
+    
+    cache.put(('a',), wav_a)
+    cache.unpin(wav_a)
+    
+    assert os.path.exists(wav_a) and os.path.exists(mp3_a)
+    assert cache.has_file(wav_a)
+    assert cache.get(('a',)) == wav_a
+
+
+def test_unpin_without_eviction_keeps_file(voices):
+    """未被淘汰的檔案釋放後保留在快取中"""
+    cache = AudioCache(max_items=2)
+    (wav_a, _), _, _ = voices
+    cache.put(('a',), wav_a)
+    cache.pin(wav_a)
+    cache.unpin(wav_a)
+    
+    assert os.path.exists(wav_a)
+    assert cache.get(('a',)) == wav_a
+    assert cache.has_file(wav_a)
+
+
+def test_known_files_from_startup_scan(tmp_path):
+    """啟動掃描登記的檔案在淘汰後同步移除"""
+    wav_a, mp3_a = _make_voice(tmp_path, "voice_a")
+    wav_b, _ = _make_voice(tmp_path, "voice_b")
+    cache = AudioCache(max_items=1, known_files={wav_a, mp3_a})
+    assert cache.has_file(wav_a) and cache.has_file(mp3_a)
+    
+    cache.put(('a',), wav_a)
+    cache.put(('b',), wav_b)
+    
+    assert not cache.has_file(wav_a)
+    assert not cache.has_file(mp3_a)
+    assert cache.has_file(wav_b)
@@ -7,8 +7,9 @@ import os
 import sys
 import time
 import threading
+from collections import deque
 from datetime import datetime
-from typing import Optional, List
+from typing import Optional, List, Dict, Callable
 import logging
 import logging
 from datetime import datetime
@@ -231,16 +232,26 @@ class FileManager:
             logger.info(f"創建目錄: {directory}")
     
     @staticmethod
-    def get_sound_file_path(filename: str) -> str:
-        """獲取音訊檔案完整路徑"""
+    def get_sound_file_path(filename: str, extension: Optional[str] = None) -> str:
+        """獲取音訊檔案完整路徑（預設使用SystemConfig.SOUND_FORMAT副檔名）"""
         FileManager.ensure_directory(SystemConfig.SOUND_DIR)
-        return os.path.join(SystemConfig.SOUND_DIR, f"{filename}.{SystemConfig.SOUND_FORMAT}")
+        extension = extension or SystemConfig.SOUND_FORMAT
+        return os.path.join(SystemConfig.SOUND_DIR, f"{filename}.{extension}")
     
     @staticmethod
     def file_exists(filepath: str) -> bool:
         """檢查檔案是否存在"""
         return os.path.exists(filepath)
     
+    @staticmethod
+    def list_files(directory: str) -> set:
+        """以單次目錄掃描列出目錄中的檔案名稱（目錄不存在時返回空集合）"""
+        try:
+            with os.scandir(directory) as entries:
+                return {entry.name for entry in entries if entry.is_file()}
+        except OSError:
+            return set()
+    
     @staticmethod
     def get_file_size(filepath: str) -> int:
         """獲取檔案大小"""
@@ -261,6 +272,7 @@ class ActionBuffer:
         """
         self.buffer_size = buffer_size
         self.buffers = {}
+        self.detected_counts = {}     # 各緩衝區中檢測到的幀數（隨增刪維護，免去每幀加總）
         self.action_states = {}
         self.action_start_times = {}  # 記錄動作開始時間
         self.action_durations = {}    # 記錄動作持續時間
@@ -273,20 +285,20 @@ class ActionBuffer:
             action: 動作名稱
             detected: 是否檢測到動作
         """
-        import time
-        
         if action not in self.buffers:
-            self.buffers[action] = []
+            self.buffers[action] = deque(maxlen=self.buffer_size)
+            self.detected_counts[action] = 0
             self.action_states[action] = False
             self.action_start_times[action] = 0
             self.action_durations[action] = 0
         
-        # 添加檢測結果到緩衝區
-        self.buffers[action].append(detected)
-        
-        # 維持緩衝區大小
-        if len(self.buffers[action]) > self.buffer_size:
-            self.buffers[action].pop(0)
+        # 添加檢測結果到緩衝區（deque已滿時自動移除最舊的結果）
+        buffer = self.buffers[action]
+        if len(buffer) == self.buffer_size and buffer[0]:
+            self.detected_counts[action] -= 1
+        buffer.append(detected)
+        if detected:
+            self.detected_counts[action] += 1
         
         # 記錄動作開始時間和持續時間
         current_time = time.time()
@@ -321,7 +333,7 @@ class ActionBuffer:
             return False
         
         # 計算檢測到的比例
-        detected_count = sum(self.buffers[action])
+        detected_count = self.detected_counts[action]
         detection_ratio = detected_count / len(self.buffers[action])
         
         # 檢查動作是否持續了足夠長的時間（至少1秒）
@@ -355,6 +367,7 @@ class ActionBuffer:
         """重置特定動作的緩衝區"""
         if action in self.buffers:
             self.buffers[action].clear()
+            self.detected_counts[action] = 0
             self.action_states[action] = False
             self.action_start_times[action] = 0
             self.action_durations[action] = 0
@@ -398,6 +411,64 @@ class PerformanceProfiler:
         self.counters.clear()
 
 
+class PygameEventPump:
+    """
+    共用的pygame事件線程
+    
+    SDL只有一個全域事件佇列，各元件分別以pygame.event.wait()讀取時會互相取走對方的事件；
+    改由單一線程讀取，並依事件類型分派給註冊的回呼
+    """
+    
+    _lock = threading.Lock()
+    _handlers: Dict[int, Callable[[], None]] = {}
+    _thread: Optional[threading.Thread] = None
+    
+    @classmethod
+    def register(cls, pygame_module, callback: Callable[[], None]) -> int:
+        """
+        配置專屬的自訂事件類型並註冊回呼，首次註冊時啟動事件線程
+        
+        Args:
+            pygame_module: 已導入的pygame模組
+            callback: 收到該類型事件時呼叫的函數（於事件線程中執行）
+            
+        Returns:
+            int: 配置的事件類型
+        """
+        with cls._lock:
+            event_type = pygame_module.event.custom_type()
+            cls._handlers[event_type] = callback
+            if cls._thread is None or not cls._thread.is_alive():
+                cls._thread = threading.Thread(target=cls._pump, args=(pygame_module,), daemon=True)
+                cls._thread.start()
+        return event_type
+    
+    @classmethod
+    def unregister(cls, event_type: Optional[int]):
+        """移除事件回呼，沒有註冊者時事件線程自行結束"""
+        with cls._lock:
+            cls._handlers.pop(event_type, None)
+    
+    @classmethod
+    def _pump(cls, pygame_module):
+        """事件線程主迴圈"""
+        while True:
+            with cls._lock:
+                if not cls._handlers:
+                    cls._thread = None
+                    return
+            try:
+                event = pygame_module.event.wait(500)
+            except Exception:
+                break
+            callback = cls._handlers.get(event.type)
+            if callback is not None:
+                callback()
+        
+        with cls._lock:
+            cls._thread = None
+
+
 # 全域工具實例
 logger = LoggerSetup.setup_logger()
 keyboard_sim = KeyboardSimulator()